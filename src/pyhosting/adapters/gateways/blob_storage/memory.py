@@ -15,6 +15,20 @@ class InMemoryBlobStorage(BlobStorageGateway):
         Does not accept argument.
         """
         self._store: t.Dict[str, bytes] = {}
+        # Keys grouped by their first key part (dicts are used as ordered sets)
+        self._index: t.Dict[str, t.Dict[str, None]] = {}
+
+    def _index_key(self, key: str) -> None:
+        """Add a key to the index of keys by first key part."""
+        self._index.setdefault(key.split("/", 1)[0], {})[key] = None
+
+    def _unindex_key(self, key: str) -> None:
+        """Remove a key from the index of keys by first key part."""
+        head = key.split("/", 1)[0]
+        keys = self._index[head]
+        del keys[key]
+        if not keys:
+            del self._index[head]
 
     def get_key(self, *parts: str) -> str:
         """Get a key from key parts"
@@ -25,7 +39,12 @@ class InMemoryBlobStorage(BlobStorageGateway):
         Returns:
             A single key derived from the key parts.
         """
-        return "/".join(key.rstrip("/") for key in parts).lstrip("/")
+        # Most keys are made of one or two parts (page id and page version)
+        if len(parts) == 1:
+            return parts[0].rstrip("/").lstrip("/")
+        if len(parts) == 2:
+            return f"{parts[0].rstrip('/')}/{parts[1].rstrip('/')}".lstrip("/")
+        return "/".join([key.rstrip("/") for key in parts]).lstrip("/")
 
     def split_key(self, key: str) -> t.List[str]:
         """Split a key into key parts.
@@ -51,6 +70,8 @@ class InMemoryBlobStorage(BlobStorageGateway):
             None
         """
         derived_key = self.get_key(*key)
+        if derived_key not in self._store:
+            self._index_key(derived_key)
         self._store[derived_key] = blob
 
     async def get(self, *key: str) -> bytes:
@@ -79,6 +100,22 @@ class InMemoryBlobStorage(BlobStorageGateway):
         derived_key = self.get_key(*key)
         if self._store.pop(derived_key, None) is None:
             raise BlobNotFoundError(derived_key)
+        self._unindex_key(derived_key)
+
+    async def delete_many(self, keys: t.List[str]) -> None:
+        """Delete blobs under several keys.
+
+        Arguments:
+            keys: a list of keys, as returned by the `.list_keys()` method.
+
+        Raises:
+            BlobNotFoundError: When no blob exist for one of the keys.
+        """
+        for key in keys:
+            derived_key = self.get_key(key)
+            if self._store.pop(derived_key, None) is None:
+                raise BlobNotFoundError(derived_key)
+            self._unindex_key(derived_key)
 
     async def list_keys(self, *prefixes: str) -> t.List[str]:
         """List keys starting with prefix.
@@ -89,7 +126,19 @@ class InMemoryBlobStorage(BlobStorageGateway):
         Returns:
             A list of keys
         """
-        if prefixes:
-            prefix = self.get_key(*prefixes)
-            return [key for key in self._store if key.startswith(prefix)]
-        return list(self._store)
+        prefix = self.get_key(*prefixes)
+        if not prefix:
+            return list(self._store)
+        head, sep, _ = prefix.partition("/")
+        # Only keys sharing the first key part of the prefix can match
+        if sep:
+            return [
+                key for key in self._index.get(head, ()) if key.startswith(prefix)
+            ]
+        # Prefix may match first key part partially
+        return [
+            key
+            for first_part, keys in self._index.items()
+            if first_part.startswith(prefix)
+            for key in keys
+        ]
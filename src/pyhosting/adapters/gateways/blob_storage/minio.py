@@ -2,7 +2,9 @@ import typing as t
 from io import BytesIO
 
 from minio import Minio, S3Error
+from minio.deleteobjects import DeleteObject
 
+from pyhosting.domain.errors import BlobNotFoundError, PyHostingError
 from pyhosting.domain.gateways import BlobStorageGateway
 
 
@@ -37,6 +39,17 @@ class MinioStorage(BlobStorageGateway):
         response = self.minio.get_object(self.bucket, "/".join(key))
         return response.read()
 
+    async def stream(
+        self, *key: str, chunk_size: int = 64 * 1024
+    ) -> t.AsyncIterator[bytes]:
+        response = self.minio.get_object(self.bucket, "/".join(key))
+        try:
+            for chunk in response.stream(chunk_size):
+                yield chunk
+        finally:
+            response.close()
+            response.release_conn()
+
     async def put(self, *key: str, blob: bytes) -> None:
         io = BytesIO(blob)
         self.minio.put_object(self.bucket, "/".join(key), io, len(blob))
@@ -44,6 +57,20 @@ class MinioStorage(BlobStorageGateway):
     async def delete(self, *key: str) -> None:
         self.minio.delete_object(self.bucket, "/".join(key))
 
+    async def delete_many(self, keys: t.List[str]) -> None:
+        # Errors are returned lazily, iterate to send the delete request
+        errors = list(
+            self.minio.remove_objects(self.bucket, [DeleteObject(key) for key in keys])
+        )
+        for error in errors:
+            if error.code == "NoSuchKey":
+                raise BlobNotFoundError(error.name or "")
+        if errors:
+            error = errors[0]
+            raise PyHostingError(
+                500, f"Failed to delete blob {error.name}: {error.code} {error.message}"
+            )
+
     async def list_keys(self, *prefixes: str) -> t.List[str]:
         return [
             item.object_name
@@ -1,3 +1,4 @@
+import asyncio
 import typing as t
 from pathlib import Path
 from shutil import rmtree
@@ -63,10 +64,16 @@ class LocalDirectory(FilestorageGateway):
             OSError: Various errors which can happen due to permissions
         """
         target = self.get_path(*destination)
+        await asyncio.get_running_loop().run_in_executor(
+            None, self._write_bytes, target, content, create_parents
+        )
+        return target
+
+    def _write_bytes(self, target: Path, content: bytes, create_parents: bool) -> None:
+        """Write bytes to target path (blocking)."""
         if create_parents:
             target.parent.mkdir(exist_ok=True, parents=True)
         target.write_bytes(content)
-        return target
 
     async def remove_directory(self, *path: str) -> bool:
         """Remove some directory.
@@ -85,6 +92,12 @@ class LocalDirectory(FilestorageGateway):
             OSError: Various errors which can happen due to permissions
         """
         target = self._root_path.joinpath(*path)
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self._remove_directory, target
+        )
+
+    def _remove_directory(self, target: Path) -> bool:
+        """Remove target directory (blocking)."""
         exists = target.is_dir()
         rmtree(target, ignore_errors=True)
         return exists
@@ -37,7 +37,11 @@ class PlayInstrumentation(BasePlayInstrumentation):
     ) -> None:
         """Observe an exception raised by an actor."""
         logger.error(
-            f"Actor '{actor.handler.__class__.__name__}' failed on subject {msg.subject} (event: {msg.spec}) with error: {exc}"
+            "Actor '%s' failed on subject %s (event: %s) with error: %s",
+            actor.handler.__class__.__name__,
+            msg.subject,
+            msg.spec,
+            exc,
         )
 
     def event_processed(
@@ -47,9 +51,13 @@ class PlayInstrumentation(BasePlayInstrumentation):
         msg: BaseMessage[t.Any, t.Any, t.Any, t.Any],
     ) -> None:
         """Observe a successful command processed"""
-        logger.info(
-            f"Actor '{actor.handler.__class__.__name__}' processed a message on subject {msg.subject}"
-        )
+        # Called for each message, avoid formatting when INFO level is disabled
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Actor '%s' processed a message on subject %s",
+                actor.handler.__class__.__name__,
+                msg.subject,
+            )
 
     def play_starting(self, play: "Play") -> None:
         """Observe play starting."""
@@ -30,6 +30,17 @@ class InMemoryPageRepository(PageRepository):
             raise PageNotFoundError(page_name)
         return self._names[page_name]
 
+    async def page_name_exists(self, page_name: str) -> bool:
+        """Return True when a page with given name exists else False.
+
+        Arguments:
+            page_name: the page name to look for
+
+        Returns:
+            `True` if a page with such name exists, else `False`
+        """
+        return page_name in self._names
+
     async def get_page(self, page_id: str) -> Page:
         """Get a single page by ID.
 
@@ -59,14 +70,14 @@ class InMemoryPageRepository(PageRepository):
         self._names[page.name] = page.id
         self._versions_store[page.id] = {}
 
-    async def delete_page(self, page_id: str) -> None:
+    async def delete_page(self, page_id: str) -> Page:
         """Delete a page.
 
         Arguments:
             page_id: the ID of page to delete
 
         Returns:
-            None
+            The deleted `Page` entity
 
         Raises:
             PageNotFoundError: when no page with such ID exist
@@ -75,6 +86,8 @@ class InMemoryPageRepository(PageRepository):
             raise PageNotFoundError(page_id)
         page = self._store.pop(page_id)
         self._names.pop(page.name)
+        self._versions_store.pop(page_id, None)
+        return page
 
     async def list_pages(self) -> t.List[Page]:
         """List existing pages. Does not accept argument.
@@ -84,6 +97,23 @@ class InMemoryPageRepository(PageRepository):
         """
         return list(self._store.values())
 
+    async def iter_pages(self, page_size: int = 500) -> t.AsyncIterator[t.List[Page]]:
+        """Iterate over existing pages by batches.
+
+        Arguments:
+            page_size: the maximum number of pages within a single batch
+
+        Returns:
+            An asynchronous iterator of lists of `Page` entities
+        """
+        page_ids = list(self._store)
+        for start in range(0, len(page_ids), page_size):
+            yield [
+                self._store[page_id]
+                for page_id in page_ids[start : start + page_size]
+                if page_id in self._store
+            ]
+
     async def update_latest_version(self, version: Version) -> None:
         """Update the latest version of a page to a new version.
 
@@ -102,9 +132,8 @@ class InMemoryPageRepository(PageRepository):
         latest version of associated page, and thus, reduce the risk of updating
         to a non existing version.
         """
-        try:
-            page = self._store[version.page_id]
-        except KeyError:
+        page = self._store.get(version.page_id)
+        if page is None:
             raise PageNotFoundError(version.page_id)
         if version.page_version not in self._versions_store[version.page_id]:
             raise VersionNotFoundError(page.name, version.page_version)
@@ -119,9 +148,10 @@ class InMemoryPageRepository(PageRepository):
         Raises:
             PageNotFoundError: when no page with such ID exists
         """
-        if page_id not in self._versions_store:
+        versions = self._versions_store.get(page_id)
+        if versions is None:
             raise PageNotFoundError(page_id)
-        return version in self._versions_store[page_id]
+        return version in versions
 
     async def get_version(self, page_id: str, page_version: str) -> Version:
         """Get a single page version.
@@ -137,17 +167,44 @@ class InMemoryPageRepository(PageRepository):
             PageNotFoundError: when page does not exist
             VersionNotFoundError: when version does not exist but page exist
         """
-        if page_id not in self._store:
+        versions = self._versions_store.get(page_id)
+        if versions is None:
             raise PageNotFoundError(page_id)
-        if page_version not in self._versions_store[page_id]:
+        version = versions.get(page_version)
+        if version is None:
             raise VersionNotFoundError(self._store[page_id].name, page_version)
-        return self._versions_store[page_id][page_version]
+        return version
+
+    async def get_latest_version(self, page_id: str) -> Version:
+        """Get the latest version of a page.
 
-    async def create_version(self, version: Version) -> None:
+        Arguments:
+            page_id: The ID of page to get latest version for
+
+        Returns:
+            A `Version` entity
+
+        Raises:
+            PageNotFoundError: when page does not exist
+            VersionNotFoundError: when page does not have a latest version
+        """
+        page = self._store.get(page_id)
+        if page is None:
+            raise PageNotFoundError(page_id)
+        if page.latest_version is None:
+            raise VersionNotFoundError(page.name, version="latest")
+        version = self._versions_store.get(page_id, {}).get(page.latest_version)
+        if version is None:
+            raise VersionNotFoundError(page.name, page.latest_version)
+        return version
+
+    async def create_version(self, version: Version, latest: bool = False) -> None:
         """Create and store a new page version. No validation is required.
 
         Arguments:
             version: a `Version` entity
+            latest: when true, page latest version is updated to the new version
+                within the same operation.
 
         Returns:
             None
@@ -156,6 +213,8 @@ class InMemoryPageRepository(PageRepository):
             self._versions_store[version.page_id][version.page_version] = version
         except KeyError:
             raise PageNotFoundError(version.page_id)
+        if latest:
+            self._store[version.page_id].latest_version = version.page_version
 
     async def delete_version(self, page_id: str, page_version: str) -> None:
         """Delete a page version.
@@ -168,11 +227,11 @@ class InMemoryPageRepository(PageRepository):
             PageNotFoundError: when page does not exist
             VersionNotFoundError: when version does not exist
         """
-        if page_id not in self._versions_store:
+        versions = self._versions_store.get(page_id)
+        if versions is None:
             raise PageNotFoundError(page_id)
-        if page_version not in self._versions_store[page_id]:
+        if versions.pop(page_version, None) is None:
             raise VersionNotFoundError(self._store[page_id].name, page_version)
-        self._versions_store[page_id].pop(page_version)
 
     async def list_versions(self, page_id: str) -> t.List[Version]:
         """List existing version for a page.
@@ -186,6 +245,7 @@ class InMemoryPageRepository(PageRepository):
         Raises:
             PageNotFoundError: when page does not exist
         """
-        if page_id not in self._versions_store:
+        versions = self._versions_store.get(page_id)
+        if versions is None:
             raise PageNotFoundError(page_id)
-        return list(self._versions_store[page_id].values())
+        return list(versions.values())
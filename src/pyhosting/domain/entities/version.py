@@ -26,7 +26,7 @@ class Version:
     """The page version. Unique."""
 
     checksum: str
-    """The page archive checksum. Note that archive are compressed using gzip and gzip checksums are not deterministic.
+    """The page archive SHA-256 checksum. Note that archive are compressed using gzip and gzip checksums are not deterministic.
 
     Thus, compressing the same directory twice will produce a different checksum.
     """
@@ -23,7 +23,7 @@ class VersionCreated:
     """Payload of version-created event."""
 
     document: Version
-    content: str
+    content: bytes
     latest: bool
 
 
@@ -1,10 +1,14 @@
 import abc
+import asyncio
 import typing as t
 
 
 class BlobStorageGateway(metaclass=abc.ABCMeta):
     """Interact with a remote blob storage."""
 
+    max_concurrency: int = 32
+    """Maximum number of concurrent requests sent by default `.delete_many()` implementation."""
+
     @abc.abstractmethod
     async def put(self, *key: str, blob: bytes) -> None:
         """Put blob under given key.
@@ -27,6 +31,27 @@ class BlobStorageGateway(metaclass=abc.ABCMeta):
         """
         raise NotImplementedError  # pragma: no cover
 
+    async def stream(
+        self, *key: str, chunk_size: int = 64 * 1024
+    ) -> t.AsyncIterator[bytes]:
+        """Read bytes under given key by chunks.
+
+        Implementations able to download blobs progressively should override
+        this method. By default, the whole blob is read using `.get()` and
+        yielded as a single chunk.
+
+        Arguments:
+            key: key parts used to derive key to get blob for
+            chunk_size: the maximum size of a chunk in bytes
+
+        Returns:
+            An asynchronous iterator of bytes
+
+        Raises:
+            BlobNotFoundError: When no blob exist for given key.
+        """
+        yield await self.get(*key)
+
     @abc.abstractmethod
     async def delete(self, *key: str) -> None:
         """Delete bytes under given key.
@@ -36,6 +61,27 @@ class BlobStorageGateway(metaclass=abc.ABCMeta):
         """
         raise NotImplementedError  # pragma: no cover
 
+    async def delete_many(self, keys: t.List[str]) -> None:
+        """Delete blobs under several keys.
+
+        Implementations able to delete several blobs within a single request
+        should override this method. By default, blobs are deleted concurrently,
+        with at most `max_concurrency` deletions in flight.
+
+        Arguments:
+            keys: a list of keys, as returned by the `.list_keys()` method.
+
+        Raises:
+            BlobNotFoundError: When no blob exist for one of the keys.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def delete(key: str) -> None:
+            async with semaphore:
+                await self.delete(key)
+
+        await asyncio.gather(*(delete(key) for key in keys))
+
     @abc.abstractmethod
     async def list_keys(self, *prefixes: str) -> t.List[str]:
         """List keys starting with prefix.
@@ -4,6 +4,7 @@ It exposes methods to:
 - create in-memory `tar` archives from directories
 - create in-memory `tar` archives from bytes
 - decompress in-memory `tar` archives from bytes into directories
+- decompress `tar` archives read from file objects into directories
 
 This module does NOT expose a method to decompress a `tar` archive present on filesytem,
 as it is not required by the applications.
@@ -20,14 +21,14 @@ from ..errors import EmptyContentError, InvalidContentError
 
 def _members_without_top_level(tar: tarfile.TarFile) -> t.Iterator[tarfile.TarInfo]:
     """Return members of a tar archive stripped from the top level directory."""
-    for member in tar.getmembers():
+    for member in tar:
         member.path = member.path.split("/", 1)[-1]
         yield member
 
 
 def _members_with_top_level(tar: tarfile.TarFile) -> t.Iterator[tarfile.TarInfo]:
     """Return members of a tar archive with top level directory."""
-    for member in tar.getmembers():
+    for member in tar:
         if member.path == ".":
             continue
         yield member
@@ -61,6 +62,30 @@ def unpack_archive(
         raise EmptyContentError()
     # Load tar archive into BytesIO
     tar_io = io.BytesIO(content)
+    return unpack_archive_fileobj(
+        tar_io,
+        destination,
+        omit_top_level=omit_top_level,
+        create_parents=create_parents,
+    )
+
+
+def unpack_archive_fileobj(
+    fileobj: t.IO[bytes],
+    destination: t.Union[str, Path],
+    omit_top_level: bool = False,
+    create_parents: bool = False,
+) -> Path:
+    """Extract some tar archive read from a file object into given destination directory.
+
+    Arguments:
+        fileobj: a binary file object to read the tar archive from
+        destination: the path to the directory where archive should be unpacked
+        omit_top_level: when false (the default) destination will contain a single parent directory with the same name as `source`.
+            when true, destination will contain files found in `source` directory without a parent directory.
+        create_parents: when false (the default) an error is raised if destination parent directory does not exist.
+            When true, destination parent directories are created if needed.
+    """
     # Initialize destination path
     destination = Path(destination)
     # Create parent directory when required
@@ -68,7 +93,7 @@ def unpack_archive(
         destination.parent.mkdir(parents=True, exist_ok=True)
     # Try to open the tar file
     try:
-        tar = tarfile.open(fileobj=tar_io)
+        tar = tarfile.open(fileobj=fileobj)
     except tarfile.TarError as exc:
         raise InvalidContentError("Content is not a valid tar archive") from exc
     # Try to extract tar file
@@ -120,10 +145,10 @@ def validate_tarfile(content: bytes, block_size: int = 1024) -> t.List[str]:
     members: t.List[str] = []
     try:
         with tarfile.open(fileobj=tar_io) as tar:
-            for member in tar.getmembers():
+            for member in tar:
                 if member.name != ".":
                     members.append(member.name)
-                reader_context = tar.extractfile(member.name)
+                reader_context = tar.extractfile(member)
                 if reader_context is None:
                     continue
                 with reader_context as reader:
@@ -5,6 +5,7 @@ Both `Page` and `Version` entities can be fetched and written using a `PageRepos
 Because there is a strong relation between pages and versions, decoupling both repositories
 would lead to more complex code, thus a single repository is used.
 """
+
 import abc
 import typing as t
 
@@ -29,6 +30,18 @@ class PageRepository(metaclass=abc.ABCMeta):
         """
         raise NotImplementedError  # pragma: no cover
 
+    @abc.abstractmethod
+    async def page_name_exists(self, page_name: str) -> bool:
+        """Return True when a page with given name exists else False.
+
+        Arguments:
+            page_name: the page name to look for
+
+        Returns:
+            `True` if a page with such name exists, else `False`
+        """
+        raise NotImplementedError  # pragma: no cover
+
     @abc.abstractmethod
     async def get_page(self, page_id: str) -> Page:
         """Get a single page by ID.
@@ -61,14 +74,14 @@ class PageRepository(metaclass=abc.ABCMeta):
         raise NotImplementedError  # pragma: no cover
 
     @abc.abstractmethod
-    async def delete_page(self, page_id: str) -> None:
+    async def delete_page(self, page_id: str) -> Page:
         """Delete a page.
 
         Arguments:
             page_id: the ID of page to delete
 
         Returns:
-            None
+            The deleted `Page` entity
 
         Raises:
             PageNotFoundError: when no page with such ID exist
@@ -84,6 +97,18 @@ class PageRepository(metaclass=abc.ABCMeta):
         """
         raise NotImplementedError  # pragma: no cover
 
+    @abc.abstractmethod
+    def iter_pages(self, page_size: int = 500) -> t.AsyncIterator[t.List[Page]]:
+        """Iterate over existing pages by batches.
+
+        Arguments:
+            page_size: the maximum number of pages within a single batch
+
+        Returns:
+            An asynchronous iterator of lists of `Page` entities
+        """
+        raise NotImplementedError  # pragma: no cover
+
     @abc.abstractmethod
     async def update_latest_version(self, version: Version) -> None:
         """Update the latest version of a page to a new version.
@@ -132,11 +157,29 @@ class PageRepository(metaclass=abc.ABCMeta):
         raise NotImplementedError  # pragma: no cover
 
     @abc.abstractmethod
-    async def create_version(self, version: Version) -> None:
+    async def get_latest_version(self, page_id: str) -> Version:
+        """Get the latest version of a page.
+
+        Arguments:
+            page_id: The ID of page to get latest version for
+
+        Returns:
+            A `Version` entity
+
+        Raises:
+            PageNotFoundError: when page does not exist
+            VersionNotFoundError: when page does not have a latest version
+        """
+        raise NotImplementedError  # pragma: no cover
+
+    @abc.abstractmethod
+    async def create_version(self, version: Version, latest: bool = False) -> None:
         """Create and store a new page version. No validation is required.
 
         Arguments:
             version: a `Version` entity
+            latest: when true, page latest version is updated to the new version
+                within the same operation.
 
         Returns:
             None
@@ -1,6 +1,7 @@
+import asyncio
 import typing as t
 from dataclasses import dataclass
-from hashlib import md5
+from hashlib import sha256
 
 from genid import IDGenerator
 
@@ -11,7 +12,6 @@ from ...errors import (
     CannotDeleteLatestVersionError,
     EmptyContentError,
     PageAlreadyExistsError,
-    PageNotFoundError,
     VersionAlreadyExistsError,
 )
 from ...events import (
@@ -28,6 +28,11 @@ from ...operations.archives import validate_archive
 from ...repositories import PageRepository
 
 
+def _checksum(content: bytes) -> str:
+    """Compute checksum of some content."""
+    return sha256(content).hexdigest()
+
+
 @dataclass
 class CreatePage:
     """Use case for creating a new page.
@@ -50,11 +55,7 @@ class CreatePage:
     ) -> Page:
         """Execute usecase: Create a new page."""
         # Check that no page exist with same name
-        try:
-            await self.page_repository.get_page_id(name)
-        except PageNotFoundError:
-            pass
-        else:
+        if await self.page_repository.page_name_exists(name):
             raise PageAlreadyExistsError(name)
         # Create the page in-memory
         page = Page(
@@ -89,6 +90,10 @@ class UpdateLatestPageVersion:
     async def __call__(self, page_id: str, page_version: str) -> None:
         """Execute usecase: Update page latest version."""
         version = await self.page_repository.get_version(page_id, page_version)
+        await self.update(version)
+
+    async def update(self, version: Version) -> None:
+        """Execute usecase using a version entity already in hand: Update page latest version."""
         await self.page_repository.update_latest_version(version)
 
 
@@ -106,8 +111,8 @@ class DeletePage:
 
     async def __call__(self, page_id: str) -> None:
         """Delete a page"""
-        page = await self.page_repository.get_page(page_id)
-        await self.page_repository.delete_page(page_id)
+        # Repository returns the deleted page, no need to query it first
+        page = await self.page_repository.delete_page(page_id)
         await self.event_bus.publish(
             PAGE_DELETED,
             scope=None,
@@ -138,31 +143,33 @@ class PublishVersion:
         if not content:
             raise EmptyContentError()
         # Query page first in order to avoid validating content if page does not exist
-        page = await self.page_repository.get_page(page_id)
-        if await self.page_repository.version_exists(page_id, page_version):
+        page, exists = await asyncio.gather(
+            self.page_repository.get_page(page_id),
+            self.page_repository.version_exists(page_id, page_version),
+        )
+        if exists:
             raise VersionAlreadyExistsError(page.name, page_version)
-        # Validate content (this should run in a threadpool)
-        validate_archive(content)
+        # Validate content and compute checksum concurrently within threadpool
+        loop = asyncio.get_running_loop()
+        _, checksum = await asyncio.gather(
+            loop.run_in_executor(None, validate_archive, content),
+            loop.run_in_executor(None, _checksum, content),
+        )
         # Create page version
         version = Version(
             page_id=page.id,
             page_name=page.name,
             page_version=page_version,
-            checksum=md5(content).hexdigest(),
+            checksum=checksum,
             created_timestamp=self.clock(),
         )
-        # Create the page version within the repository
-        await self.page_repository.create_version(version)
-        # Update latest reference
-        if latest:
-            await self.page_repository.update_latest_version(version)
+        # Create the page version and update latest reference within the repository
+        await self.page_repository.create_version(version, latest=latest)
         # Emit a page version created event holding version document but NOT version content
         await self.event_bus.publish(
             VERSION_CREATED,
             scope=None,
-            payload=VersionCreated(
-                document=version, content=content.hex(), latest=latest
-            ),
+            payload=VersionCreated(document=version, content=content, latest=latest),
             metadata={},
         )
         return version
@@ -183,14 +190,18 @@ class DeletePageVersion:
     async def __call__(self, page_id: str, page_version: str) -> None:
         """Delete a page version"""
         page = await self.page_repository.get_page(page_id)
+        await self.delete(page, page_version)
+
+    async def delete(self, page: Page, page_version: str) -> None:
+        """Delete a page version using a page entity already in hand"""
         if page.latest_version == page_version:
             raise CannotDeleteLatestVersionError(page.name, page.latest_version)
-        await self.page_repository.delete_version(page_id, page_version)
+        await self.page_repository.delete_version(page.id, page_version)
         await self.event_bus.publish(
             VERSION_DELETED,
             scope=None,
             payload=VersionDeleted(
-                page_id=page_id,
+                page_id=page.id,
                 page_version=page_version,
                 page_name=page.name,
             ),
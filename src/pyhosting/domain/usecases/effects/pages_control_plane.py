@@ -20,6 +20,8 @@ from ...gateways import BlobStorageGateway
 class UploadContentOnVersionCreated:
     """Upload a new version to blob storage on `version-created` event."""
 
+    __slots__ = ("event_bus", "storage")
+
     event_bus: AllowPublish
     storage: BlobStorageGateway
 
@@ -28,8 +30,7 @@ class UploadContentOnVersionCreated:
         page_id = msg.data.document.page_id
         page_name = msg.data.document.page_name
         page_version = msg.data.document.page_version
-        blob = bytes.fromhex(msg.data.content)
-        await self.storage.put(page_id, page_version, blob=blob)
+        await self.storage.put(page_id, page_version, blob=msg.data.content)
         await self.event_bus.publish(
             VERSION_UPLOADED,
             scope=None,
@@ -47,6 +48,8 @@ class UploadContentOnVersionCreated:
 class CleanStorageOnVersionDeleted:
     """Delete a version from blob storage on `version-deleted` event."""
 
+    __slots__ = ("storage",)
+
     storage: BlobStorageGateway
 
     async def __call__(self, msg: Message[None, VersionDeleted, None]) -> None:
@@ -58,10 +61,11 @@ class CleanStorageOnVersionDeleted:
 class CleanStorageOnPageDeleted:
     """Delete all versions from blob storage on `page-deleted` event."""
 
+    __slots__ = ("storage",)
+
     storage: BlobStorageGateway
 
     async def __call__(self, msg: Message[None, PageDeleted, None]) -> None:
         """Process a `page-deleted` event."""
         blob_keys = await self.storage.list_keys(msg.data.page_id)
-        for key in blob_keys:
-            await self.storage.delete(key)
+        await self.storage.delete_many(blob_keys)
@@ -1,45 +1,83 @@
+import asyncio
+import typing as t
 from dataclasses import dataclass
+from functools import partial
+from io import BytesIO
+from tempfile import SpooledTemporaryFile
 
 from synopsys import Message
 
 from ...events import PageCreated, PageDeleted, VersionDeleted, VersionUploaded
 from ...gateways import BlobStorageGateway, FilestorageGateway, TemplateLoader
-from ...operations.archives import unpack_archive
+from ...operations.archives import unpack_archive_fileobj
 from ...templates import DEFAULT_TEMPLATE
 
+SPOOL_MAX_SIZE = 8 * 1024 * 1024
+"""Size in bytes above which downloaded archives are spooled to disk before being unpacked."""
+
 
 @dataclass
 class UpdateCacheOnVersionUploaded:
     """Download page version from blob storage into local storage on `version-uploaded` event."""
 
+    __slots__ = ("local_storage", "blob_storage")
+
     local_storage: FilestorageGateway
     blob_storage: BlobStorageGateway
 
+    async def _download(self, version: VersionUploaded) -> t.IO[bytes]:
+        """Download a page version archive into a file object positioned at start."""
+        if type(self.blob_storage).stream is BlobStorageGateway.stream:
+            # Blob storage does not stream, archive is read in memory at once
+            return BytesIO(
+                await self.blob_storage.get(version.page_id, version.page_version)
+            )
+        loop = asyncio.get_running_loop()
+        spool = SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+        try:
+            async for chunk in self.blob_storage.stream(
+                version.page_id, version.page_version
+            ):
+                # Spool may roll over to disk, do not write from the event loop
+                await loop.run_in_executor(None, spool.write, chunk)
+            spool.seek(0)
+        except BaseException:
+            spool.close()
+            raise
+        return spool
+
     async def __call__(self, msg: Message[None, VersionUploaded, None]) -> None:
         """Process a `version-uploaded` event."""
         version = msg.data
-        # Download from blob storage
-        content = await self.blob_storage.get(version.page_id, version.page_version)
-        # Write content into local storage
         version_directory = self.local_storage.get_path(
             version.page_name, version.page_version
         )
-        unpack_archive(
-            content, version_directory, omit_top_level=True, create_parents=True
-        )
+        with await self._download(version) as archive:
+            # Write content into local storage without blocking the event loop
+            await asyncio.get_running_loop().run_in_executor(
+                None,
+                partial(
+                    unpack_archive_fileobj,
+                    archive,
+                    version_directory,
+                    omit_top_level=True,
+                    create_parents=True,
+                ),
+            )
         # Update latest symlink
         if version.is_latest:
             # Rewrite latest symlink
-            version_directory.parent.joinpath("__latest__").unlink(missing_ok=True)
-            version_directory.parent.joinpath("__latest__").symlink_to(
-                version_directory, target_is_directory=True
-            )
+            latest_link = version_directory.parent.joinpath("__latest__")
+            latest_link.unlink(missing_ok=True)
+            latest_link.symlink_to(version_directory, target_is_directory=True)
 
 
 @dataclass
 class CleanCacheOnVersionDeleted:
     """Remove page version from local storage on `version-deleted` event."""
 
+    __slots__ = ("local_storage",)
+
     local_storage: FilestorageGateway
 
     async def __call__(self, event: Message[None, VersionDeleted, None]) -> None:
@@ -53,6 +91,8 @@ class CleanCacheOnVersionDeleted:
 class CleanCacheOnPageDeleted:
     """Delete all pages version from local storage on `page-deleted` event."""
 
+    __slots__ = ("local_storage",)
+
     local_storage: FilestorageGateway
 
     async def __call__(self, event: Message[None, PageDeleted, None]) -> None:
@@ -64,6 +104,14 @@ class CleanCacheOnPageDeleted:
 class InitCacheOnPageCreated:
     """Generate default index.html for latest page on `page-created` event."""
 
+    __slots__ = (
+        "local_storage",
+        "base_url",
+        "templates",
+        "default_template",
+        "render_default_template",
+    )
+
     local_storage: FilestorageGateway
     base_url: str
     templates: TemplateLoader
@@ -72,12 +120,14 @@ class InitCacheOnPageCreated:
         self.default_template = self.templates.load_template(
             DEFAULT_TEMPLATE.read_text()
         )
+        # Base URL never changes, bind it once
+        self.render_default_template = partial(
+            self.default_template.render, base_url=self.base_url
+        )
 
     async def __call__(self, event: Message[None, PageCreated, None]) -> None:
         """Process a `page-created` event."""
-        index = self.default_template.render(
-            page=event.data.document, base_url=self.base_url
-        )
+        index = self.render_default_template(page=event.data.document)
         await self.local_storage.write_bytes(
             event.data.document.name,
             "__default__",
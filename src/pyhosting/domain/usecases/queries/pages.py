@@ -2,7 +2,6 @@ import typing as t
 from dataclasses import dataclass
 
 from ...entities import Page, Version
-from ...errors import VersionNotFoundError
 from ...repositories import PageRepository
 
 
@@ -14,6 +13,8 @@ class GetPage:
         repository: an implementation of `PageRepository`.
     """
 
+    __slots__ = ("page_repository",)
+
     page_repository: PageRepository
 
     async def __call__(self, page_id: str) -> Page:
@@ -29,17 +30,25 @@ class ListPages:
         repository: An implementation of `PageRepository`.
     """
 
+    __slots__ = ("page_repository",)
+
     page_repository: PageRepository
 
     async def __call__(self) -> t.List[Page]:
         """Execute usecase: List existing pages."""
         return await self.page_repository.list_pages()
 
+    def iter(self, page_size: int = 500) -> t.AsyncIterator[t.List[Page]]:
+        """Execute usecase: Iterate over existing pages by batches."""
+        return self.page_repository.iter_pages(page_size)
+
 
 @dataclass
 class GetPageVersion:
     """Use case for retrieving an existing page."""
 
+    __slots__ = ("page_repository",)
+
     page_repository: PageRepository
 
     async def __call__(self, page_id: str, page_version: str) -> Version:
@@ -53,26 +62,24 @@ class GetPageVersion:
 class GetLatestPageVersion:
     """Use case for retrieving an existing page."""
 
+    __slots__ = ("page_repository",)
+
     page_repository: PageRepository
 
     async def __call__(self, page_id: str) -> Version:
         """Execute usecase: Get a page version."""
-        page = await self.page_repository.get_page(page_id=page_id)
-        if page.latest_version is None:
-            raise VersionNotFoundError(page.name, version="latest")
-        version = await self.page_repository.get_version(
-            page_id=page_id, page_version=page.latest_version
-        )
-        return version
+        return await self.page_repository.get_latest_version(page_id=page_id)
 
 
 @dataclass
 class ListPagesVersions:
     """Use case for listing existing page versions."""
 
+    __slots__ = ("page_repository",)
+
     page_repository: PageRepository
 
     async def __call__(self, page_id: str) -> t.List[Version]:
         """Execute usecase: List existing pages."""
-        await self.page_repository.get_page(page_id=page_id)
+        # Repository raises a PageNotFoundError when page does not exist
         return await self.page_repository.list_versions(page_id=page_id)
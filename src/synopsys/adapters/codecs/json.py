@@ -4,22 +4,43 @@ The library orjson is used when available, else the standard library is used.
 """
 import json
 import typing as t
-from dataclasses import asdict, is_dataclass
+from base64 import b64encode
+from dataclasses import fields, is_dataclass
 from datetime import datetime
 
 from pydantic import BaseModel
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 
 def _default_serializer(obj: t.Any) -> t.Any:
+    # Dataclasses are serialized shallowly, nested values are handled by
+    # the encoder itself, which avoids the deep copy performed by `asdict`
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {field.name: getattr(obj, field.name) for field in fields(obj)}
     if isinstance(obj, datetime):
         return obj.isoformat()
-    if isinstance(obj, (bytes, bytearray, set)):
+    if isinstance(obj, (bytes, bytearray)):
+        return b64encode(obj).decode("ascii")
+    if isinstance(obj, set):
         return list(obj)
     if isinstance(obj, BaseModel):
         return obj.dict()
     raise TypeError
 
 
+def _orjson_option(indent: bool, sort_keys: bool) -> int:
+    option = orjson.OPT_NON_STR_KEYS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS
+    return option
+
+
 def dumps(
     v: t.Any,
     *,
@@ -28,19 +49,19 @@ def dumps(
     sort_keys: bool = False,
     **kwargs: t.Any,
 ) -> str:
-    """Serialize Python objects to a JSON string using standard library."""
-    if v is None:
-        return ""
-    if v == b"":
+    """Serialize Python objects to a JSON string using orjson or standard library."""
+    if v is None or v == b"":
         return ""
     if isinstance(v, str):
         return v
-    if isinstance(v, datetime):
-        return v.isoformat()
-    if is_dataclass(v):
-        v = asdict(v)
     if isinstance(v, BaseModel):
         return v.json(indent=indent if indent else 0, sort_keys=sort_keys)
+    if isinstance(v, datetime):
+        return v.isoformat()
+    if orjson is not None and not kwargs:
+        return orjson.dumps(
+            v, default=default, option=_orjson_option(indent, sort_keys)
+        ).decode("utf-8")
     json_str = json.dumps(
         v,
         default=default,
@@ -61,7 +82,7 @@ def dump(
     sort_keys: bool = False,
     **kwargs: t.Any,
 ) -> bytes:
-    """Serialize Python objects to JSON bytes using standard library."""
+    """Serialize Python objects to JSON bytes using orjson or standard library."""
     if v is None:
         return b""
     if isinstance(v, bytes):
@@ -74,11 +95,9 @@ def dump(
         )
     if isinstance(v, datetime):
         return v.isoformat().encode("utf-8")
-    if is_dataclass(v):
-        v = asdict(v)
-    if isinstance(v, BaseModel):
-        return v.json(indent=indent if indent else 0, sort_keys=sort_keys).encode(
-            "utf-8"
+    if orjson is not None and not kwargs:
+        return orjson.dumps(
+            v, default=default, option=_orjson_option(indent, sort_keys)
         )
     return json.dumps(
         v,
@@ -1,4 +1,8 @@
+import json
 import typing as t
+from base64 import b64decode
+from dataclasses import fields, is_dataclass
+from functools import lru_cache
 
 from pydantic import parse_obj_as, parse_raw_as
 
@@ -9,6 +13,52 @@ from .json import dump
 T = t.TypeVar("T")
 
 
+def _unwrap_optional(hint: t.Any) -> t.Any:
+    """Return X when hint is Optional[X], else return hint unchanged."""
+    if t.get_origin(hint) is t.Union:
+        args = [arg for arg in t.get_args(hint) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return hint
+
+
+@lru_cache
+def _bytes_fields(schema: t.Any) -> t.Tuple[t.Tuple[str, t.Any], ...]:
+    """Find dataclass fields which may hold bytes.
+
+    Returns a tuple of field name and nested dataclass schema. Nested schema
+    is None for fields annotated as bytes.
+    """
+    hints = t.get_type_hints(schema)
+    bytes_fields: t.List[t.Tuple[str, t.Any]] = []
+    for field in fields(schema):
+        hint = _unwrap_optional(hints.get(field.name))
+        if hint is bytes:
+            bytes_fields.append((field.name, None))
+        elif is_dataclass(hint):
+            bytes_fields.append((field.name, hint))
+    return tuple(bytes_fields)
+
+
+def _decode_bytes_fields(obj: t.Any, schema: t.Any) -> t.Any:
+    """Decode base64 strings found in dataclass fields annotated as bytes.
+
+    Bytes are encoded as base64 strings within JSON documents, but pydantic
+    does not decode base64 strings into bytes.
+    """
+    if not isinstance(obj, dict):
+        return obj
+    for name, nested in _bytes_fields(schema):
+        if name not in obj:
+            continue
+        value = obj[name]
+        if nested is not None:
+            obj[name] = _decode_bytes_fields(value, nested)
+        elif isinstance(value, str):
+            obj[name] = b64decode(value)
+    return obj
+
+
 class PydanticCodec(Codec):
     def encode(self, data: t.Any) -> bytes:
         return dump(data)
@@ -16,6 +66,8 @@ class PydanticCodec(Codec):
     def decode(self, raw: bytes, schema: t.Type[T]) -> T:
         if schema is bytes and isinstance(raw, bytes):
             return t.cast(T, raw)
+        if is_dataclass(schema):
+            return parse_obj_as(schema, _decode_bytes_fields(json.loads(raw), schema))
         return parse_raw_as(schema, raw)
 
     def parse_obj(
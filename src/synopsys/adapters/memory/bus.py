@@ -1,7 +1,7 @@
 import typing as t
-from asyncio import Queue as AIOQueue
-from asyncio import QueueFull, Task, create_task, wait_for
+from asyncio import QueueFull, wait_for
 from contextlib import asynccontextmanager
+from functools import lru_cache
 
 from genid.generators import NUIDGenerator
 
@@ -18,10 +18,93 @@ from synopsys import (
     ScopeT,
 )
 
+from .mailbox import Mailbox
 from .messages import InMemoryMessage, InMemoryRequest
 
 __all__ = ["InMemoryEventBus"]
 
+MATCH_CACHE_SIZE = 1024
+"""Maximum number of subjects for which match results are cached for each wildcard observer."""
+
+# Observers are stored with bound methods used to match subjects and deliver
+# messages, so that these methods are not looked up on each message.
+_Subscribers = t.Dict[
+    "Mailbox[InMemoryMessage[t.Any, t.Any, t.Any]]",
+    t.Tuple[
+        t.Callable[[str], bool],
+        str,
+        t.Callable[[InMemoryMessage[t.Any, t.Any, t.Any]], None],
+    ],
+]
+_Responders = t.Dict[
+    "Mailbox[InMemoryRequest[t.Any, t.Any, t.Any, t.Any]]",
+    t.Tuple[
+        t.Callable[[str], bool],
+        str,
+        t.Callable[[InMemoryRequest[t.Any, t.Any, t.Any, t.Any]], None],
+    ],
+]
+
+
+def _is_static(event: EventSpec[t.Any, t.Any, t.Any, t.Any]) -> bool:
+    """Return True if event filter subject does not contain any wildcard.
+
+    A static filter subject only matches a subject equal to itself.
+    """
+    return event._static
+
+
+def _matcher(event: EventSpec[t.Any, t.Any, t.Any, t.Any]) -> t.Callable[[str], bool]:
+    """Return a function used to check if event matches a subject.
+
+    Results are cached for wildcard filter subjects, because messages are
+    usually published on a small set of subjects.
+    """
+    if _is_static(event):
+        return event.match_subject
+    return lru_cache(maxsize=MATCH_CACHE_SIZE)(event.match_subject)
+
+
+def _deliver(
+    observers: t.Optional[t.Dict[t.Any, t.Tuple[t.Callable[[str], bool], str, t.Any]]],
+    wildcard_observers: t.Dict[t.Any, t.Tuple[t.Callable[[str], bool], str, t.Any]],
+    subject: str,
+    msg: t.Any,
+) -> None:
+    """Deliver a message to observers matching subject.
+
+    Only a single observer within a queue group receives the message.
+    The set of processed queue groups is only allocated when needed.
+    """
+    queues_processed: t.Optional[t.Set[str]] = None
+    if observers:
+        for _, queue, put in observers.values():
+            if queue and queues_processed and queue in queues_processed:
+                continue
+            try:
+                put(msg)
+            except QueueFull:
+                continue
+            if queue:
+                if queues_processed is None:
+                    queues_processed = {queue}
+                else:
+                    queues_processed.add(queue)
+    for match, queue, put in wildcard_observers.values():
+        if queue and queues_processed and queue in queues_processed:
+            continue
+        if not match(subject):
+            continue
+        try:
+            put(msg)
+        except QueueFull:
+            continue
+        if queue:
+            if queues_processed is None:
+                queues_processed = {queue}
+            else:
+                queues_processed.add(queue)
+
 
 class InMemoryEventBus(EventBus):
     """Implementation of an in-memory event-bus.
@@ -36,21 +119,23 @@ class InMemoryEventBus(EventBus):
         - Requesters CANNOT communicate a reply subject. It means that actors MUST know before hand the reply subject.
     """
 
-    def __init__(self) -> None:
-        self.subscribers: t.List[
-            t.Tuple[
-                EventSpec[t.Any, t.Any, t.Any, t.Any],
-                str,
-                AIOQueue[InMemoryMessage[t.Any, t.Any, t.Any]],
-            ],
-        ] = []
-        self.responders: t.List[
-            t.Tuple[
-                EventSpec[t.Any, t.Any, t.Any, t.Any],
-                str,
-                AIOQueue[InMemoryRequest[t.Any, t.Any, t.Any, t.Any]],
-            ],
-        ] = []
+    def __init__(self, max_pending: int = 0) -> None:
+        """Create a new in-memory event bus.
+
+        Arguments:
+            max_pending: maximum number of pending messages for each observer. Messages delivered to an observer with too many pending messages are dropped (or delivered to another member of the same queue group). Unbounded when zero (the default).
+        """
+        self.max_pending = max_pending
+        # Subscribers with a static filter subject are indexed by subject,
+        # so that publishing does not need to scan all subscribers.
+        # Subscribers are stored in dicts keyed by their queue so that
+        # they can be removed in constant time.
+        self.subscribers: t.Dict[str, _Subscribers] = {}
+        # Subscribers with a wildcard filter subject must be matched one by one
+        self.wildcard_subscribers: _Subscribers = {}
+        # Responders are indexed the same way as subscribers
+        self.responders: t.Dict[str, _Responders] = {}
+        self.wildcard_responders: _Responders = {}
         self.nuid = NUIDGenerator()
 
     async def __request_event(
@@ -101,37 +186,23 @@ class InMemoryEventBus(EventBus):
         self, msg: InMemoryMessage[ScopeT, DataT, MetadataT]
     ) -> None:
         """Emit an event."""
-        queues_processed: t.Set[str] = set()
-        for target, queue, observer in self.subscribers:
-            if queue and queue in queues_processed:
-                continue
-            if not target.match_subject(msg.subject):
-                continue
-            try:
-                observer.put_nowait(msg)
-            except QueueFull:
-                continue
-            else:
-                if queue:
-                    queues_processed.add(queue)
+        _deliver(
+            self.subscribers.get(msg.subject),
+            self.wildcard_subscribers,
+            msg.subject,
+            msg,
+        )
 
     def __notify_command_observers(
         self, request: InMemoryRequest[ScopeT, DataT, MetadataT, ReplyT]
     ) -> None:
         """Emit an event."""
-        queues_processed: t.Set[str] = set()
-        for target, queue, responder in self.responders:
-            if queue and queue in queues_processed:
-                continue
-            if not target.match_subject(request.subject):
-                continue
-            try:
-                responder.put_nowait(request)
-            except QueueFull:
-                continue
-            else:
-                if queue:
-                    queues_processed.add(queue)
+        _deliver(
+            self.responders.get(request.subject),
+            self.wildcard_responders,
+            request.subject,
+            request,
+        )
 
     @asynccontextmanager
     async def subscribe(
@@ -139,26 +210,32 @@ class InMemoryEventBus(EventBus):
         event: EventSpec[ScopeT, DataT, MetadataT, ReplyT],
         queue: t.Optional[str] = None,
     ) -> t.AsyncIterator[t.AsyncIterator[Message[ScopeT, DataT, MetadataT]]]:
-        """Create a new observer, optionally within a queue."""
+        """Create a new observer, optionally within a queue.
+
+        Consumers waiting on the iterator are cancelled when the context exits.
+        """
         queue = queue or ""
-        observer: "AIOQueue[InMemoryMessage[ScopeT, DataT, MetadataT]]" = AIOQueue()
-        key = (event, queue, observer)
-        self.subscribers.append(key)
-        current_task: t.Optional[Task[InMemoryMessage[ScopeT, DataT, MetadataT]]] = None
+        observer: "Mailbox[InMemoryMessage[ScopeT, DataT, MetadataT]]" = Mailbox(
+            self.max_pending
+        )
+        if _is_static(event):
+            subscribers = self.subscribers.setdefault(event._subject, {})
+        else:
+            subscribers = self.wildcard_subscribers
+        subscribers[observer] = (_matcher(event), queue, observer.put_nowait)
 
         async def iterator() -> t.AsyncIterator[Message[ScopeT, DataT, MetadataT]]:
-            nonlocal current_task
-            nonlocal observer
             while True:
-                current_task = create_task(observer.get())
-                yield await wait_for(current_task, timeout=None)
+                yield await observer.get()
 
         try:
             yield iterator()
         finally:
-            if current_task:
-                current_task.cancel()
-            self.subscribers.remove(key)
+            # Wake up consumer waiting for a message, if any
+            observer.close()
+            del subscribers[observer]
+            if not subscribers and subscribers is not self.wildcard_subscribers:
+                self.subscribers.pop(event._subject, None)
 
     @asynccontextmanager
     async def serve(
@@ -166,32 +243,34 @@ class InMemoryEventBus(EventBus):
         event: EventSpec[ScopeT, DataT, MetadataT, ReplyT],
         queue: t.Optional[str] = None,
     ) -> t.AsyncIterator[t.AsyncIterator[Request[ScopeT, DataT, MetadataT, ReplyT]]]:
+        """Create a new responder, optionally within a queue.
+
+        Consumers waiting on the iterator are cancelled when the context exits.
+        """
         queue = queue or ""
-        observer: "AIOQueue[InMemoryRequest[ScopeT, DataT, MetadataT, ReplyT]]" = (
-            AIOQueue()
+        observer: "Mailbox[InMemoryRequest[ScopeT, DataT, MetadataT, ReplyT]]" = (
+            Mailbox(self.max_pending)
         )
-        key = (event, queue, observer)
-        self.responders.append(key)
-        current_task: t.Optional[
-            Task[InMemoryRequest[ScopeT, DataT, MetadataT, ReplyT]]
-        ] = None
+        if _is_static(event):
+            responders = self.responders.setdefault(event._subject, {})
+        else:
+            responders = self.wildcard_responders
+        responders[observer] = (_matcher(event), queue, observer.put_nowait)
 
         async def iterator() -> t.AsyncIterator[
             Request[ScopeT, DataT, MetadataT, ReplyT]
         ]:
-            nonlocal current_task
-            nonlocal observer
             while True:
-                print("Waiting for an event")
-                current_task = create_task(observer.get())
-                yield await wait_for(current_task, timeout=None)
+                yield await observer.get()
 
         try:
             yield iterator()
         finally:
-            if current_task:
-                current_task.cancel()
-            self.responders.remove(key)
+            # Wake up consumer waiting for a request, if any
+            observer.close()
+            del responders[observer]
+            if not responders and responders is not self.wildcard_responders:
+                self.responders.pop(event._subject, None)
 
     def pull(
         self, queue: EventQueue[ScopeT, DataT, MetadataT]
@@ -0,0 +1,72 @@
+import typing as t
+from asyncio import CancelledError, Future, QueueFull, get_running_loop
+from collections import deque
+
+__all__ = ["Mailbox"]
+
+T = t.TypeVar("T")
+
+
+class Mailbox(t.Generic[T]):
+    """A minimal FIFO queue with a single consumer.
+
+    Each observer created by the in-memory event bus is consumed by a single
+    iterator, so unlike `asyncio.Queue`, a mailbox only keeps track of a
+    single waiting consumer and does not track unfinished tasks.
+    """
+
+    __slots__ = ("_items", "_waiter", "_maxsize", "_closed")
+
+    def __init__(self, maxsize: int = 0) -> None:
+        """Create a new mailbox.
+
+        Arguments:
+            maxsize: maximum number of items in the mailbox. Mailbox is unbounded when zero (the default).
+        """
+        self._items: t.Deque[T] = deque()
+        self._waiter: t.Optional[Future[None]] = None
+        self._maxsize = maxsize
+        self._closed = False
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def put_nowait(self, item: T) -> None:
+        """Put an item into the mailbox and wake up consumer if needed.
+
+        Raises:
+            QueueFull: when mailbox is bounded and full.
+        """
+        if self._maxsize and len(self._items) >= self._maxsize:
+            raise QueueFull
+        self._items.append(item)
+        waiter = self._waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    def close(self) -> None:
+        """Close the mailbox and cancel the waiting consumer, if any.
+
+        Items already in the mailbox can still be consumed.
+        """
+        self._closed = True
+        waiter = self._waiter
+        if waiter is not None and not waiter.done():
+            waiter.cancel()
+
+    async def get(self) -> T:
+        """Remove and return an item from the mailbox, waiting for an item if needed.
+
+        Raises:
+            CancelledError: when mailbox is closed and empty.
+        """
+        while not self._items:
+            if self._closed:
+                raise CancelledError
+            waiter = get_running_loop().create_future()
+            self._waiter = waiter
+            try:
+                await waiter
+            finally:
+                self._waiter = None
+        return self._items.popleft()
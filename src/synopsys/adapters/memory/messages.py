@@ -1,3 +1,5 @@
+import typing as t
+
 from synopsys import (
     EMPTY,
     DataT,
@@ -14,6 +16,8 @@ __all__ = ["InMemoryMessage", "InMemoryRequest"]
 
 
 class BaseInMemoryMessage(BaseMessage[ScopeT, DataT, MetadataT, ReplyT]):
+    __slots__ = ("_event", "_payload", "_headers", "_subject", "_scope")
+
     def __init__(
         self,
         event: EventSpec[ScopeT, DataT, MetadataT, ReplyT],
@@ -25,7 +29,7 @@ class BaseInMemoryMessage(BaseMessage[ScopeT, DataT, MetadataT, ReplyT]):
         self._payload = payload
         self._headers = headers
         self._subject = subject
-        self._scope = self._event.extract_scope(self._subject)
+        self._scope = event.extract_scope(subject)
 
     @property
     def subject(self) -> str:
@@ -49,28 +53,33 @@ class BaseInMemoryMessage(BaseMessage[ScopeT, DataT, MetadataT, ReplyT]):
     def spec(self) -> EventSpec[ScopeT, DataT, MetadataT, ReplyT]:
         return self._event
 
-    def __eq__(self, other: object) -> bool:
-        if (
-            self._event == getattr(other, "_event", None)
-            and self._payload == getattr(other, "_payload", None)
-            and self._headers == getattr(other, "_headers", None)
-            and self._scope == getattr(other, "_scope", None)
-        ):
-            return True
-        return False
+    def equals(self, other: object) -> bool:
+        """Return True when other message holds the same event, data, metadata and scope.
+
+        Messages use identity equality, this method can be used to compare messages by value.
+        """
+        return (
+            type(self) is type(other)
+            and self._event == other._event
+            and self._payload == other._payload
+            and self._headers == other._headers
+            and self._scope == other._scope
+        )
 
 
 class InMemoryMessage(
     BaseInMemoryMessage[ScopeT, DataT, MetadataT, None],
     Message[ScopeT, DataT, MetadataT],
 ):
-    pass
+    __slots__ = ()
 
 
 class InMemoryRequest(
     BaseInMemoryMessage[ScopeT, DataT, MetadataT, ReplyT],
     Request[ScopeT, DataT, MetadataT, ReplyT],
 ):
+    __slots__ = ("_reply", "_publisher", "_reply_event_spec")
+
     def __init__(
         self,
         event: EventSpec[ScopeT, DataT, MetadataT, ReplyT],
@@ -83,15 +92,24 @@ class InMemoryRequest(
         super().__init__(event, subject, payload, headers)
         self._reply = _reply
         self._publisher = _publisher
-        self._reply_event = EventSpec(
-            name="reply",
-            address=self._reply,
-            scope=EMPTY,
-            schema=self.spec.reply_schema,
-            reply_schema=EMPTY,
-            metadata_schema=self.spec.metadata_schema,
-            syntax=self.spec.syntax,
-        )
+        self._reply_event_spec: t.Optional[
+            EventSpec[t.Any, ReplyT, MetadataT, t.Any]
+        ] = None
+
+    @property
+    def _reply_event(self) -> EventSpec[t.Any, ReplyT, MetadataT, t.Any]:
+        """The event used to reply to the request, created on first access."""
+        if self._reply_event_spec is None:
+            self._reply_event_spec = EventSpec(
+                name="reply",
+                address=self._reply,
+                scope=EMPTY,
+                schema=self.spec.reply_schema,
+                reply_schema=EMPTY,
+                metadata_schema=self.spec.metadata_schema,
+                syntax=self.spec.syntax,
+            )
+        return self._reply_event_spec
 
     async def reply(self, payload: ReplyT) -> None:
         await self._publisher.publish(
@@ -28,6 +28,19 @@ class NATSEventBus(EventBus):
         self.nc = nc
         self.codec = codec
 
+    def _encode_headers(self, metadata: t.Any) -> t.Dict[str, str]:
+        """Convert metadata into NATS headers.
+
+        Metadata is usually a dict of strings already, in which case it is
+        used as is instead of being validated by the codec.
+        """
+        if type(metadata) is dict and all(
+            type(key) is str and type(value) is str
+            for key, value in metadata.items()
+        ):
+            return metadata
+        return self.codec.parse_obj(metadata, t.Dict[str, str])
+
     async def publish(
         self,
         event: EventSpec[ScopeT, DataT, MetadataT, None],
@@ -40,7 +53,7 @@ class NATSEventBus(EventBus):
         await self.nc.publish(
             subject=event.get_subject(scope),
             payload=self.codec.encode(payload),
-            headers=self.codec.parse_obj(metadata, t.Dict[str, str]),
+            headers=self._encode_headers(metadata),
         )
         # Flush if a timeout is provided
         if timeout is not None:
@@ -59,7 +72,7 @@ class NATSEventBus(EventBus):
         reply = await self.nc.request(
             subject=event.get_subject(scope),
             payload=self.codec.encode(payload),
-            headers=self.codec.parse_obj(metadata, t.Dict[str, str]),
+            headers=self._encode_headers(metadata),
             timeout=timeout or 10,
         )
         # Decode request data
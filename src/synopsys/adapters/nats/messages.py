@@ -10,8 +10,13 @@ __all__ = ["NATSMessage", "NATSRequest"]
 
 T = t.TypeVar("T")
 
+_UNSET: t.Any = object()
+"""Sentinel used to detect message fields which have not been decoded yet."""
+
 
 class BaseNATSMessage(BaseMessage[ScopeT, DataT, MetadataT, ReplyT]):
+    __slots__ = ("_codec", "_event", "_msg", "_scope", "_data", "_metadata")
+
     def __init__(
         self,
         event: EventSpec[ScopeT, DataT, MetadataT, ReplyT],
@@ -21,11 +26,9 @@ class BaseNATSMessage(BaseMessage[ScopeT, DataT, MetadataT, ReplyT]):
         self._codec = codec
         self._event = event
         self._msg = msg
-        self._scope = self._event.extract_scope(msg.subject)
-        self._data = self._codec.decode(self._msg.data, self._event.schema)
-        self._metadata = self._codec.parse_obj(
-            self._msg.headers, self._event.metadata_schema
-        )
+        self._scope = event.extract_scope(msg.subject)
+        self._data: DataT = _UNSET
+        self._metadata: MetadataT = _UNSET
 
     @property
     def subject(self) -> str:
@@ -34,7 +37,12 @@ class BaseNATSMessage(BaseMessage[ScopeT, DataT, MetadataT, ReplyT]):
 
     @property
     def data(self) -> DataT:
-        """Return event data found in message."""
+        """Return event data found in message.
+
+        Data is decoded on first access only.
+        """
+        if self._data is _UNSET:
+            self._data = self._codec.decode(self._msg.data, self._event.schema)
         return self._data
 
     @property
@@ -44,6 +52,10 @@ class BaseNATSMessage(BaseMessage[ScopeT, DataT, MetadataT, ReplyT]):
 
     @property
     def metadata(self) -> MetadataT:
+        if self._metadata is _UNSET:
+            self._metadata = self._codec.parse_obj(
+                self._msg.headers, self._event.metadata_schema
+            )
         return self._metadata
 
     @property
@@ -55,13 +67,15 @@ class NATSMessage(
     BaseNATSMessage[ScopeT, DataT, MetadataT, None],
     Message[ScopeT, DataT, MetadataT],
 ):
-    pass
+    __slots__ = ()
 
 
 class NATSRequest(
     BaseNATSMessage[ScopeT, DataT, MetadataT, ReplyT],
     Request[ScopeT, DataT, MetadataT, ReplyT],
 ):
+    __slots__ = ()
+
     async def reply(self, payload: ReplyT) -> None:
         if not self._msg.reply:
             return
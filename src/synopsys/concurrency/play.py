@@ -10,6 +10,146 @@ from ..instrumentation.play import PlayInstrumentation
 from .errors import ExceptionGroup
 
 
+def _event_processed_observer(
+    instrumentation: PlayInstrumentation,
+) -> t.Optional[t.Callable[["Play", Actor, t.Any], None]]:
+    """Return the method observing processed events.
+
+    None is returned when instrumentation does not override the default no-op
+    method, so that runners can skip the call for each message.
+    """
+    if type(instrumentation).event_processed is PlayInstrumentation.event_processed:
+        return None
+    return instrumentation.event_processed
+
+
+async def _run_responder(
+    actor: Responder[ScopeT, DataT, MetadataT, ReplyT],
+    iterator: t.AsyncIterator[Request[ScopeT, DataT, MetadataT, ReplyT]],
+    instrumentation: PlayInstrumentation,
+    play: "Play",
+) -> None:
+    """Task defined for each responder"""
+    handler = actor.handler
+    processed = _event_processed_observer(instrumentation)
+    failed = instrumentation.event_processing_failed
+    async for request in iterator:
+        try:
+            # Handle command
+            result = await handler(request)
+            # Reply result
+            await request.reply(result)
+        except Exception as exc:
+            # Log and exit on exception.
+            failed(play, actor, request, exc)
+        else:
+            if processed is not None:
+                processed(play, actor, request)
+
+
+async def _run_subscriber(
+    actor: Subscriber[ScopeT, DataT, MetadataT],
+    iterator: t.AsyncIterator[Message[ScopeT, DataT, MetadataT]],
+    instrumentation: PlayInstrumentation,
+    play: "Play",
+) -> None:
+    """Task defined for each subscriber"""
+    handler = actor.handler
+    processed = _event_processed_observer(instrumentation)
+    failed = instrumentation.event_processing_failed
+    async for event in iterator:
+        try:
+            await handler(event)
+        except Exception as exc:
+            # Log and exit on exception.
+            failed(play, actor, event, exc)
+        else:
+            if processed is not None:
+                processed(play, actor, event)
+
+
+async def _run_consumer(
+    actor: Consumer[ScopeT, DataT, MetadataT],
+    iterator: t.AsyncIterator[Job[ScopeT, DataT, MetadataT]],
+    instrumentation: PlayInstrumentation,
+    play: "Play",
+) -> None:
+    """Task defined for each consumer"""
+    handler = actor.handler
+    processed = _event_processed_observer(instrumentation)
+    failed = instrumentation.event_processing_failed
+    async for job in iterator:
+        # Do we want to auto-ack ??
+        try:
+            await handler(job)
+        except Exception as exc:
+            # Log and exit on exception.
+            failed(play, actor, job, exc)
+        else:
+            if processed is not None:
+                processed(play, actor, job)
+
+
+_Starter = t.Callable[
+    ["Play", t.Any, AsyncExitStack],
+    t.Awaitable[t.Coroutine[t.Any, t.Any, None]],
+]
+
+
+async def _start_responder(
+    play: "Play",
+    actor: Responder[t.Any, t.Any, t.Any, t.Any],
+    stack: AsyncExitStack,
+) -> t.Coroutine[t.Any, t.Any, None]:
+    """Enter responder context and return coroutine processing requests"""
+    iterator = await stack.enter_async_context(play.bus.serve(actor.event))
+    return _run_responder(actor, iterator, play.instrumentation, play)
+
+
+async def _start_subscriber(
+    play: "Play",
+    actor: Subscriber[t.Any, t.Any, t.Any],
+    stack: AsyncExitStack,
+) -> t.Coroutine[t.Any, t.Any, None]:
+    """Enter subscriber context and return coroutine processing events"""
+    iterator = await stack.enter_async_context(play.bus.subscribe(actor.event))
+    return _run_subscriber(actor, iterator, play.instrumentation, play)
+
+
+async def _start_consumer(
+    play: "Play",
+    actor: Consumer[t.Any, t.Any, t.Any],
+    stack: AsyncExitStack,
+) -> t.Coroutine[t.Any, t.Any, None]:
+    """Enter consumer context and return coroutine processing jobs"""
+    iterator = await stack.enter_async_context(play.bus.pull(actor.queue))
+    return _run_consumer(actor, iterator, play.instrumentation, play)
+
+
+_STARTERS: t.Dict[t.Type[Actor], _Starter] = {
+    Responder: _start_responder,
+    Subscriber: _start_subscriber,
+    Consumer: _start_consumer,
+}
+"""Functions used to start actors, keyed by actor type."""
+
+
+def _resolve_starter(actor_type: t.Type[Actor]) -> _Starter:
+    """Find the function used to start actors of given type.
+
+    Actor subclasses are resolved using their MRO and cached.
+
+    Raises:
+        TypeError: when actor type is not supported
+    """
+    for base in actor_type.__mro__:
+        starter = _STARTERS.get(base)
+        if starter is not None:
+            _STARTERS[actor_type] = starter
+            return starter
+    raise TypeError(f"Actor type not supported: {actor_type}")
+
+
 class Play:
     def __init__(
         self,
@@ -27,13 +167,19 @@ class Play:
         delivery regardless of the queue option.
         """
         self.instrumentation = instrumentation or PlayInstrumentation()
-        self.actors = list(actors)
+        self.actors: t.List[Actor] = []
+        self._actor_ids: t.Set[int] = set()
+        self._add_actors(actors)
         self.queue = queue
         self.bus = bus
         self.auto_connect = auto_connect
         # Initialize state
         self.tasks: t.List[asyncio.Task[None]] = []
         self.stack: t.Optional[AsyncExitStack] = None
+        self._stopping = False
+        # Actors of tasks which are not finished yet, keyed by task
+        self._pending: t.Dict["asyncio.Task[None]", Actor] = {}
+        self._all_done: t.Optional[asyncio.Event] = None
 
     async def __aenter__(self) -> "Play":
         """Implement asynchronous context manager."""
@@ -44,115 +190,32 @@ class Play:
         """Implement asynchronous context manager."""
         await self.stop()
 
-    def _collect_exceptions(self) -> t.Iterator[BaseException]:
-        """Collect all actors tasks exceptions"""
-        for task in self.tasks:
-            if not task.done():
-                continue
-            if task.cancelled():
-                continue
-            else:
-                err = task.exception()
-                if err:
-                    yield err
-
-    def _cancel_on_first_exception(
-        self, actor: Actor
-    ) -> t.Callable[["asyncio.Task[None]"], None]:
-        """Create a done callback for an actor."""
-
-        def callback(task_done: "asyncio.Task[None]") -> None:
-            """Cancel remaining actors tasks on first task completion (success or error)"""
-            if task_done.cancelled():
-                self.instrumentation.actor_cancelled(self, actor)
-                return
-            err = task_done.exception()
-            if err is not None:
-                for task in self.tasks:
-                    if not task.done():
-                        task.cancel()
-
-        return callback
-
-    def _process_requests_iterator(
-        self, actor: Responder[ScopeT, DataT, MetadataT, ReplyT]
-    ) -> t.Callable[
-        [t.AsyncIterator[Request[ScopeT, DataT, MetadataT, ReplyT]]],
-        t.Coroutine[t.Any, t.Any, None],
-    ]:
-        async def task(
-            iterator: t.AsyncIterator[Request[ScopeT, DataT, MetadataT, ReplyT]]
-        ) -> None:
-            """Task defined for each responder"""
-            # Services receive tuples of (event, reply)
-            async for request in iterator:
-                try:
-                    # Handle command
-                    result = await actor.handler(request)
-                    # Reply result
-                    await request.reply(result)
-                except Exception as exc:
-                    # Log and exit on exception.
-                    self.instrumentation.event_processing_failed(
-                        self, actor, request, exc
-                    )
-                else:
-                    self.instrumentation.event_processed(self, actor, request)
-
-        return task
-
-    def _process_events_iterator(
-        self, actor: Subscriber[ScopeT, DataT, MetadataT]
-    ) -> t.Callable[
-        [t.AsyncIterator[Message[ScopeT, DataT, MetadataT]]],
-        t.Coroutine[t.Any, t.Any, None],
-    ]:
-        async def task(
-            iterator: t.AsyncIterator[Message[ScopeT, DataT, MetadataT]]
-        ) -> None:
-            """Task defined for each subscriber"""
-            async for event in iterator:
-                try:
-                    await actor.handler(event)
-                except Exception as exc:
-                    # Log and exit on exception.
-                    self.instrumentation.event_processing_failed(
-                        self, actor, event, exc
-                    )
-                else:
-                    self.instrumentation.event_processed(self, actor, event)
-
-        return task
-
-    def _process_jobs_iterator(
-        self, actor: Consumer[ScopeT, DataT, MetadataT]
-    ) -> t.Callable[
-        [t.AsyncIterator[Job[ScopeT, DataT, MetadataT]]],
-        t.Coroutine[t.Any, t.Any, None],
-    ]:
-        async def task(
-            iterator: t.AsyncIterator[Job[ScopeT, DataT, MetadataT]]
-        ) -> None:
-            """Task defined for each consumer"""
-            async for job in iterator:
-                # Do we want to auto-ack ??
-                try:
-                    await actor.handler(job)
-                except Exception as exc:
-                    # Log and exit on exception.
-                    self.instrumentation.event_processing_failed(self, actor, job, exc)
-                else:
-                    self.instrumentation.event_processed(self, actor, job)
-
-        return task
+    def _on_task_done(self, task_done: "asyncio.Task[None]") -> None:
+        """Cancel remaining actors tasks on first task completion (success or error)"""
+        actor = self._pending.pop(task_done)
+        if not self._pending and self._all_done is not None:
+            self._all_done.set()
+        if task_done.cancelled():
+            self.instrumentation.actor_cancelled(self, actor)
+            return
+        if task_done.exception() is not None:
+            self.cancel()
 
     def cancel(self) -> None:
-        for task in self.tasks:
-            if not task.done():
-                task.cancel()
+        """Cancel all actors tasks which are not finished yet."""
+        if not self._pending:
+            return
+        # Done callbacks are scheduled on the event loop, so pending tasks
+        # are not modified while iterating
+        for task in self._pending:
+            task.cancel()
 
     async def start(self) -> None:
-        """Start the actor group."""
+        """Start the actor group.
+
+        Actors tasks are created on the running event loop, and the play
+        must be stopped from this same event loop.
+        """
         if self.stack is not None:
             return
         if self.auto_connect:
@@ -160,29 +223,14 @@ class Play:
         self.instrumentation.play_starting(self)
         self.stack = AsyncExitStack()
         await self.stack.__aenter__()
+        self._all_done = asyncio.Event()
+        create_task = asyncio.get_running_loop().create_task
         for actor in self.actors:
             self.instrumentation.actor_starting(self, actor)
-            if isinstance(actor, Responder):
-                request_handler = self._process_requests_iterator(actor)
-                request_iterator = await self.stack.enter_async_context(
-                    self.bus.serve(actor.event)
-                )
-                task = asyncio.create_task(request_handler(request_iterator))
-            elif isinstance(actor, Subscriber):
-                message_handler = self._process_events_iterator(actor)
-                message_iterator = await self.stack.enter_async_context(
-                    self.bus.subscribe(actor.event)
-                )
-                task = asyncio.create_task(message_handler(message_iterator))
-            elif isinstance(actor, Consumer):
-                job_handler = self._process_jobs_iterator(actor)
-                job_iterator = await self.stack.enter_async_context(
-                    self.bus.pull(actor.queue)
-                )
-                task = asyncio.create_task(job_handler(job_iterator))
-            else:
-                raise TypeError(f"Actor type not supported: {type(actor)}")
-            task.add_done_callback(self._cancel_on_first_exception(actor))
+            starter = _STARTERS.get(type(actor)) or _resolve_starter(type(actor))
+            task = create_task(await starter(self, actor, self.stack))
+            task.add_done_callback(self._on_task_done)
+            self._pending[task] = actor
             self.tasks.append(task)
             self.instrumentation.actor_started(self, actor)
         self.stack.push_async_callback(self.cancel_and_wait, timeout=10)
@@ -194,9 +242,14 @@ class Play:
         await self.wait(timeout=timeout)
 
     async def stop(self) -> None:
-        """Stop actor group."""
-        if self.stack is None:
+        """Stop actor group.
+
+        Play is stopped at most once, even when stop is called again while
+        play is stopping.
+        """
+        if self.stack is None or self._stopping:
             return
+        self._stopping = True
         self.instrumentation.play_stopping(self)
         try:
             await self.stack.__aexit__(*sys.exc_info())
@@ -210,31 +263,53 @@ class Play:
                 await self.bus.close()
 
     async def wait(self, timeout: t.Optional[float] = None) -> None:
-        """Wait until the play is stopped (until all actors are stopped)."""
+        """Wait until the play is stopped (until all actors are stopped).
+
+        Actors tasks are not awaited directly, instead, an event is set
+        once the done callback of the last task has been called.
+        """
+        if self._all_done is None or not self.tasks:
+            return
         try:
-            await asyncio.wait(
-                self.tasks, timeout=timeout, return_when=asyncio.ALL_COMPLETED
-            )
-        # Raised when an exception is raised within a task and future is not set
-        except ValueError:
+            await asyncio.wait_for(self._all_done.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
             pass
 
     def errors(self) -> t.List[BaseException]:
         """Get all errors raised by actors during play which are not cancelled errors."""
-        return list(self._collect_exceptions())
+        return [
+            err
+            for task in self.tasks
+            if task.done()
+            and not task.cancelled()
+            and (err := task.exception()) is not None
+        ]
 
     def started(self) -> bool:
         """Return True if play is started."""
         return self.stack is not None
 
     def done(self) -> bool:
-        """Return True if play is finished."""
-        if self.tasks:
-            return all(task.done() for task in self.tasks)
-        return False
+        """Return True if play is finished.
+
+        A task is considered finished once its done callback has been called.
+        """
+        return bool(self.tasks) and not self._pending
 
     def extend(self, *actors: Actor) -> None:
-        """Extend play with new actors."""
+        """Extend play with new actors.
+
+        Actors already part of the play are ignored.
+        """
         if self.started():
             raise RuntimeError("Cannot extend play after it is started.")
-        self.actors.extend(actors)
+        self._add_actors(actors)
+
+    def _add_actors(self, actors: t.Iterable[Actor]) -> None:
+        """Add actors which are not already part of the play."""
+        for actor in actors:
+            actor_id = id(actor)
+            if actor_id in self._actor_ids:
+                continue
+            self._actor_ids.add(actor_id)
+            self.actors.append(actor)
@@ -13,11 +13,19 @@ class Waiter(t.Generic[MsgT]):
     ) -> None:
         """Do not use __init__ constructor directly. Instead of .create() classmethod."""
         self.channel = observable
+        # Resolved once channel is entered, or when task exits early
+        self._ready: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
         self.task = asyncio.create_task(self.__start_in_foreground())
+        self.task.add_done_callback(self.__set_ready)
+
+    def __set_ready(self, _: t.Any = None) -> None:
+        if not self._ready.done():
+            self._ready.set_result(None)
 
     async def __start_in_foreground(self) -> MsgT:
         """Wait for a single event."""
         async with self.channel as observer:
+            self.__set_ready()
             async for item in observer:
                 return item
         raise ValueError("No event received")
@@ -27,9 +35,13 @@ class Waiter(t.Generic[MsgT]):
         cls,
         channel: t.AsyncContextManager[t.AsyncIterator[MsgT]],
     ) -> "Waiter[MsgT]":
-        """Create and start waiter in background."""
+        """Create and start waiter in background.
+
+        Waiter is returned once channel is entered, so that events
+        emitted after this method returns are observed.
+        """
         waiter = cls(channel)
-        await asyncio.sleep(0)
+        await waiter._ready
         return waiter
 
     async def wait(self, timeout: t.Optional[float] = 5) -> MsgT:
@@ -6,6 +6,8 @@ from .types import DataT, MetadataT, ReplyT, ScopeT
 
 
 class Actor:
+    __slots__ = ()
+
     handler: t.Callable[
         [t.Any],
         t.Coroutine[t.Any, t.Any, t.Any],
@@ -23,6 +25,8 @@ class Actor:
 
 
 class Subscriber(Actor, t.Generic[ScopeT, DataT, MetadataT]):
+    __slots__ = ("event", "handler")
+
     event: Event[ScopeT, DataT, MetadataT]
     """Event triggering the actor."""
 
@@ -55,6 +59,8 @@ class Subscriber(Actor, t.Generic[ScopeT, DataT, MetadataT]):
 
 
 class Responder(Actor, t.Generic[ScopeT, DataT, MetadataT, ReplyT]):
+    __slots__ = ("event", "handler")
+
     event: Service[ScopeT, DataT, MetadataT, ReplyT]
     """Event triggering the actor."""
 
@@ -87,6 +93,8 @@ class Responder(Actor, t.Generic[ScopeT, DataT, MetadataT, ReplyT]):
 
 
 class Consumer(Actor, t.Generic[ScopeT, DataT, MetadataT]):
+    __slots__ = ("queue", "handler")
+
     queue: EventQueue[ScopeT, DataT, MetadataT]
     """Event queue triggering the actor."""
 
@@ -17,11 +17,16 @@ This API has been designed in order to allow integration with messaging system a
 See ..interfaces subpackage in order to learn more about integration with messaging systems.
 """
 import typing as t
+from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 
 from .syntax import DEFAULT_SYNTAX, FilterSyntax
 from .types import EMPTY, DataT, MetadataT, ReplyT, ScopeT
 from .utils import (
+    compile_filter_subject,
+    compile_placeholders_pattern,
+    compile_subject_template,
     extract_subject_placeholders,
     filter_match,
     normalize_filter_subject,
@@ -41,6 +46,42 @@ __all__ = [
 ]
 
 
+ADDRESS_CACHE_SIZE = 1024
+"""Maximum number of parsed addresses kept in cache."""
+
+
+class _ParsedAddress(t.NamedTuple):
+    subject: str
+    placeholders: t.Dict[str, int]
+    tokens: t.Tuple[str, ...]
+    static: bool
+    pattern: t.Optional[t.Pattern[str]]
+    placeholder_names: t.Tuple[str, ...]
+    placeholders_pattern: t.Pattern[str]
+    template: t.Optional[str]
+
+
+@lru_cache(maxsize=ADDRESS_CACHE_SIZE)
+def _parse_address(address: str, syntax: FilterSyntax) -> _ParsedAddress:
+    """Parse an event address into a filter subject, placeholders, tokens and match pattern.
+
+    Results are shared between events, and must not be modified.
+    """
+    subject, placeholders = normalize_filter_subject(address, syntax)
+    tokens = tuple(subject.split(syntax.match_sep))
+    return _ParsedAddress(
+        subject,
+        placeholders,
+        tokens,
+        not any(
+            token == syntax.match_one or token == syntax.match_all for token in tokens
+        ),
+        compile_filter_subject(subject, syntax),
+        *compile_placeholders_pattern(placeholders, syntax),
+        compile_subject_template(tokens, placeholders, syntax),
+    )
+
+
 class EventSpec(t.Generic[ScopeT, DataT, MetadataT, ReplyT]):
     """An event is a specification.
 
@@ -54,6 +95,27 @@ class EventSpec(t.Generic[ScopeT, DataT, MetadataT, ReplyT]):
     - The Reply type defines the typed object which can be extracted from the reply message payload.
     """
 
+    __slots__ = (
+        "name",
+        "title",
+        "description",
+        "address",
+        "scope",
+        "schema",
+        "reply_schema",
+        "metadata_schema",
+        "syntax",
+        "_subject",
+        "_placeholders",
+        "_tokens",
+        "_static",
+        "_pattern",
+        "_placeholder_names",
+        "_placeholders_pattern",
+        "_template",
+        "_repr",
+    )
+
     name: str
     """The event name."""
 
@@ -105,38 +167,59 @@ class EventSpec(t.Generic[ScopeT, DataT, MetadataT, ReplyT]):
         self.description = description or ""
         self.syntax = syntax or DEFAULT_SYNTAX
         # Save some attributes to easily match or extract subjects
-        self._subject, self._placeholders = normalize_filter_subject(
-            self.address, self.syntax
-        )
-        self._tokens = self._subject.split(self.syntax.match_sep)
+        (
+            self._subject,
+            self._placeholders,
+            self._tokens,
+            self._static,
+            self._pattern,
+            self._placeholder_names,
+            self._placeholders_pattern,
+            self._template,
+        ) = _parse_address(self.address, self.syntax)
+        self._repr = f"Event(name='{self.name}', address='{self.address}', schema={self.schema.__name__})"
         # Do not validate the address if scope does not have annotations
-        if not hasattr(self.scope, "__annotations__"):
+        annotations = getattr(self.scope, "__annotations__", None)
+        if annotations is None:
             return
         # Ensure that address is valid according to scope annotations
-        if len(self.scope.__annotations__) > len(self._placeholders):
-            missing = list(
-                set(self.scope.__annotations__).difference(self._placeholders)
-            )
+        if annotations.keys() == self._placeholders.keys():
+            return
+        if len(annotations) > len(self._placeholders):
+            missing = list(annotations.keys() - self._placeholders.keys())
             raise ValueError(
                 f"Not enough placeholders in address or unexpected scope variable. Missing in address: {missing}"
             )
-        if len(self.scope.__annotations__) < len(self._placeholders):
-            unexpected = list(
-                set(self._placeholders).difference(self.scope.__annotations__)
-            )
+        if len(annotations) < len(self._placeholders):
+            unexpected = list(self._placeholders.keys() - annotations.keys())
             raise ValueError(
                 f"Too many placeholders in address or missing scope variables. Did not expect in address: {unexpected}"
             )
 
     def __repr__(self) -> str:
-        return f"Event(name='{self.name}', address='{self.address}', schema={self.schema.__name__})"
+        return self._repr
 
     def match_subject(self, subject: str) -> bool:
         """Return True if event matches given subject."""
-        return filter_match(self._subject, subject, self.syntax)
+        if not subject:
+            raise ValueError("Subject cannot be empty")
+        # Filter subjects without wildcard only match themselves
+        if self._static:
+            return subject == self._subject
+        if self._pattern is None:
+            return filter_match(self._subject, subject, self.syntax)
+        return self._pattern.fullmatch(subject) is not None
 
     def get_subject(self, scope: ScopeT) -> str:
         """Construct a subject using given scope."""
+        if self._template is not None:
+            try:
+                # Formatting str subclasses (such as str enums) may not give their value
+                if all(type(scope[name]) is str for name in self._placeholder_names):  # type: ignore[index]
+                    return self._template.format_map(scope)  # type: ignore[arg-type]
+            except (KeyError, TypeError):
+                # Let the generic function raise an error for missing placeholders
+                pass
         return render_subject(
             tokens=self._tokens,
             placeholders=self._placeholders,
@@ -146,17 +229,26 @@ class EventSpec(t.Generic[ScopeT, DataT, MetadataT, ReplyT]):
 
     def extract_scope(self, subject: str) -> ScopeT:
         """Extract placeholders from subject"""
-        return t.cast(
-            ScopeT,
-            extract_subject_placeholders(subject, self._placeholders, self.syntax),
-        )
+        # Subject does not need to be parsed when there is no placeholder
+        if not self._placeholders:
+            return t.cast(ScopeT, {})
+        match = self._placeholders_pattern.match(subject)
+        if match is None:
+            # Let the generic function raise an error for missing placeholders
+            return t.cast(
+                ScopeT,
+                extract_subject_placeholders(subject, self._placeholders, self.syntax),
+            )
+        return t.cast(ScopeT, dict(zip(self._placeholder_names, match.groups())))
 
 
 class Service(EventSpec[ScopeT, DataT, MetadataT, ReplyT]):
-    pass
+    __slots__ = ()
 
 
 class StaticService(Service[None, DataT, MetadataT, ReplyT]):
+    __slots__ = ()
+
     def __init__(
         self,
         name: str,
@@ -181,10 +273,15 @@ class StaticService(Service[None, DataT, MetadataT, ReplyT]):
         )
 
     def get_subject(self, scope: None = None) -> str:
+        # Filter subject is the subject when address does not have placeholders
+        if not self._placeholders:
+            return self._subject
         return super().get_subject(scope)
 
 
 class Event(EventSpec[ScopeT, DataT, MetadataT, None]):
+    __slots__ = ()
+
     def __init__(
         self,
         name: str,
@@ -210,6 +307,8 @@ class Event(EventSpec[ScopeT, DataT, MetadataT, None]):
 
 
 class StaticEvent(Event[None, DataT, MetadataT]):
+    __slots__ = ()
+
     def __init__(
         self,
         name: str,
@@ -221,17 +320,20 @@ class StaticEvent(Event[None, DataT, MetadataT]):
         syntax: t.Optional[FilterSyntax] = None,
     ) -> None:
         super().__init__(
-            name=name,
-            address=address,
-            schema=schema,
-            scope=EMPTY,
-            metadata_schema=metadata_schema,
-            title=title,
-            description=description,
-            syntax=syntax,
+            name,
+            address,
+            EMPTY,
+            schema,
+            metadata_schema,
+            title,
+            description,
+            syntax,
         )
 
     def get_subject(self, scope: None = None) -> str:
+        # Filter subject is the subject when address does not have placeholders
+        if not self._placeholders:
+            return self._subject
         return super().get_subject(scope)
 
 
@@ -243,6 +345,7 @@ class QueuePolicy(str, Enum):
     NEW = "NEW"
 
 
+@dataclass
 class EventStream:
     """A stream is a source of events."""
 
@@ -256,6 +359,7 @@ class EventStream:
     """Maximum number of messages to keep within stream."""
 
 
+@dataclass
 class EventQueue(t.Generic[ScopeT, DataT, MetadataT]):
     """A queue is a stateful view of a stream. It acts as interface for clients to consume a subset of messages stored in a stream and will keep track of which messages were delivered and acknowledged by clients."""
 
@@ -265,9 +369,6 @@ class EventQueue(t.Generic[ScopeT, DataT, MetadataT]):
     stream: EventStream
     """The stream associated with the consumer."""
 
-    filters: t.Optional[t.List[Event[ScopeT, DataT, MetadataT]]]
-    """A subset of events tracked by the queue."""
-
     max_pending: int
     """Defines the maximum number of messages, without an acknowledgement, that can be outstanding.
 
@@ -285,3 +386,6 @@ class EventQueue(t.Generic[ScopeT, DataT, MetadataT]):
 
     policy: QueuePolicy
     """The point in the stream to receive messages from."""
+
+    filters: t.Optional[t.List[Event[ScopeT, DataT, MetadataT]]] = None
+    """A subset of events tracked by the queue. All stream events are tracked when None."""
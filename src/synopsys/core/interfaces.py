@@ -20,6 +20,8 @@ class Codec(t.Protocol):
 class BaseMessage(t.Protocol[ScopeT, DataT, MetadataT, ReplyT]):
     """A message is the container of an event."""
 
+    __slots__ = ()
+
     @property
     def subject(self) -> str:
         ...  # pragma: no cover
@@ -44,12 +46,14 @@ class BaseMessage(t.Protocol[ScopeT, DataT, MetadataT, ReplyT]):
 class Message(BaseMessage[ScopeT, DataT, MetadataT, None]):
     """A message is the container of an event without reply."""
 
-    pass
+    __slots__ = ()
 
 
 class Request(BaseMessage[ScopeT, DataT, MetadataT, ReplyT]):
     """A request is the container of an event which must be replied to."""
 
+    __slots__ = ()
+
     async def reply(self, payload: ReplyT) -> None:
         ...  # pragma: no cover
 
@@ -57,6 +61,8 @@ class Request(BaseMessage[ScopeT, DataT, MetadataT, ReplyT]):
 class Job(Message[ScopeT, DataT, MetadataT]):
     """A Job is a container of an event which must be acknowledged."""
 
+    __slots__ = ()
+
     async def ack(self) -> None:
         ...  # pragma: no cover
 
@@ -1,9 +1,12 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True)
 class FilterSyntax:
-    """Address filter syntax."""
+    """Address filter syntax.
+
+    Syntax is frozen so that it can be used as a cache key.
+    """
 
     match_sep: str = "."
     """The character used to separate filter tokens."""
@@ -81,13 +81,64 @@ def extract_subject_placeholders(
     return values
 
 
+def compile_placeholders_pattern(
+    placeholders: t.Dict[str, int],
+    syntax: FilterSyntax,
+) -> t.Tuple[t.Tuple[str, ...], t.Pattern[str]]:
+    """Compile a regular expression extracting placeholders from subjects.
+
+    Arguments:
+        placeholders: a dict of placeholder names and token indexes
+        syntax: subject syntax
+
+    Returns:
+        A tuple of two elements: (names, pattern) where names are placeholder
+        names ordered as pattern groups. Pattern must be matched from the
+        start of subjects, and does not match subjects with missing tokens.
+    """
+    sep = re.escape(syntax.match_sep)
+    token = f"([^{sep}]*)"
+    names = tuple(sorted(placeholders, key=placeholders.__getitem__))
+    indexes = set(placeholders.values())
+    if not indexes:
+        return names, re.compile("")
+    parts = [
+        token if idx in indexes else f"[^{sep}]*" for idx in range(max(indexes) + 1)
+    ]
+    return names, re.compile(sep.join(parts) + f"(?:{sep}|$)", re.DOTALL)
+
+
+def compile_subject_template(
+    tokens: t.Sequence[str],
+    placeholders: t.Dict[str, int],
+    syntax: FilterSyntax,
+) -> t.Optional[str]:
+    """Compile subject tokens into a template which can be rendered using `str.format_map`.
+
+    Arguments:
+        tokens: filter subject tokens
+        placeholders: a dict of placeholder names and token indexes
+        syntax: subject syntax
+
+    Returns:
+        A format string, or None when a placeholder name cannot be used
+        as a format field name.
+    """
+    if not all(name.isidentifier() for name in placeholders):
+        return None
+    parts = [token.replace("{", "{{").replace("}", "}}") for token in tokens]
+    for name, idx in placeholders.items():
+        parts[idx] = "{" + name + "}"
+    return syntax.match_sep.join(parts)
+
+
 def render_subject(
-    tokens: t.List[str],
+    tokens: t.Sequence[str],
     placeholders: t.Dict[str, int],
     context: t.Any,
     syntax: FilterSyntax,
 ) -> str:
-    tokens = tokens.copy()
+    tokens = list(tokens)
     placeholders = placeholders.copy()
     if context:
         for key, value in dict(context).items():
@@ -143,3 +194,33 @@ def filter_match(
     if token == syntax.match_one and (total_tokens - idx) > 1:
         return False
     return matches
+
+
+def compile_filter_subject(
+    filter: str,
+    syntax: FilterSyntax,
+) -> t.Optional[t.Pattern[str]]:
+    """Compile a filter subject into a regular expression matching subjects.
+
+    Arguments:
+        filter: the filter subject to compile
+        syntax: subject syntax
+
+    Returns:
+        A compiled pattern which must fully match subjects, or None when
+        the match all token is used anywhere else than as the last token.
+    """
+    sep = re.escape(syntax.match_sep)
+    tokens = filter.split(syntax.match_sep)
+    last = len(tokens) - 1
+    parts: t.List[str] = []
+    for idx, token in enumerate(tokens):
+        if token == syntax.match_all:
+            if idx != last:
+                return None
+            parts.append(".*")
+        elif token == syntax.match_one:
+            parts.append(f"[^{sep}]*")
+        else:
+            parts.append(re.escape(token))
+    return re.compile(sep.join(parts), re.DOTALL)
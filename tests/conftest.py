@@ -5,12 +5,75 @@ import pytest
 from _pytest.fixtures import SubRequest
 from genid import IDGenerator, generator
 
-from pyhosting.adapters.gateways import InMemoryBlobStorage, TemporaryDirectory
-from pyhosting.adapters.repositories import InMemoryPageRepository
 from pyhosting.domain.gateways import BlobStorageGateway, FilestorageGateway
 from pyhosting.domain.repositories import PageRepository
 from synopsys import EventBus
-from synopsys.adapters.memory import InMemoryEventBus
+
+T = t.TypeVar("T")
+
+
+# Adapters are imported within factories so that collecting tests
+# does not import every adapter implementation.
+def _memory_event_bus(**options: t.Any) -> EventBus:
+    from synopsys.adapters.memory import InMemoryEventBus
+
+    return InMemoryEventBus(**options)
+
+
+def _memory_page_repository(**options: t.Any) -> PageRepository:
+    from pyhosting.adapters.repositories.memory import InMemoryPageRepository
+
+    return InMemoryPageRepository(**options)
+
+
+def _memory_blob_storage(**options: t.Any) -> BlobStorageGateway:
+    from pyhosting.adapters.gateways.blob_storage.memory import InMemoryBlobStorage
+
+    return InMemoryBlobStorage(**options)
+
+
+def _temporary_local_storage(**options: t.Any) -> FilestorageGateway:
+    from pyhosting.adapters.gateways.filesystem.temporary import TemporaryDirectory
+
+    return TemporaryDirectory(**options)
+
+
+_EVENT_BUS_FACTORIES: t.Dict[str, t.Callable[..., EventBus]] = {
+    "memory": _memory_event_bus,
+}
+_PAGE_REPOSITORY_FACTORIES: t.Dict[str, t.Callable[..., PageRepository]] = {
+    "memory": _memory_page_repository,
+}
+_BLOB_STORAGE_FACTORIES: t.Dict[str, t.Callable[..., BlobStorageGateway]] = {
+    "memory": _memory_blob_storage,
+}
+_LOCAL_STORAGE_FACTORIES: t.Dict[str, t.Callable[..., FilestorageGateway]] = {
+    "temporary": _temporary_local_storage,
+}
+
+
+def _build(
+    request: SubRequest,
+    factories: t.Dict[str, t.Callable[..., T]],
+    default: str,
+    name: str,
+) -> T:
+    """Build an object using fixture parameter.
+
+    Fixture parameter is either an implementation name, or a tuple of
+    implementation name and options.
+    """
+    param = getattr(request, "param", default)
+    if isinstance(param, tuple):
+        kind, options = param
+    else:
+        kind = param
+        options = {}
+    try:
+        factory = factories[kind]
+    except KeyError:
+        raise ValueError(f"Unknown {name} implementation: {kind}")
+    return factory(**options)
 
 
 @pytest.fixture
@@ -32,54 +95,22 @@ def id_generator(request: SubRequest) -> IDGenerator:
 @pytest.fixture
 def event_bus(request: SubRequest) -> EventBus:
     """Create an event bus to use within tests."""
-    param = getattr(request, "param", "memory")
-    if isinstance(param, tuple):
-        kind, options = param
-    else:
-        kind = param
-        options = {}
-    if kind == "memory":
-        return InMemoryEventBus(**options)
-    raise ValueError(f"Unknown event bus implementation: {kind}")
+    return _build(request, _EVENT_BUS_FACTORIES, "memory", "event bus")
 
 
 @pytest.fixture
 def page_repository(request: SubRequest) -> PageRepository:
     """Create a page repository to use within tests."""
-    param = getattr(request, "param", "memory")
-    if isinstance(param, tuple):
-        kind, options = param
-    else:
-        kind = param
-        options = {}
-    if kind == "memory":
-        return InMemoryPageRepository(**options)
-    raise ValueError(f"Unknown page repository implementation: {kind}")
+    return _build(request, _PAGE_REPOSITORY_FACTORIES, "memory", "page repository")
 
 
 @pytest.fixture
 def blob_storage(request: SubRequest) -> BlobStorageGateway:
     """Create a blob storage to use within tests."""
-    param = getattr(request, "param", "memory")
-    if isinstance(param, tuple):
-        kind, options = param
-    else:
-        kind = param
-        options = {}
-    if kind == "memory":
-        return InMemoryBlobStorage(**options)
-    raise ValueError(f"Unknown blob storage implementation: {kind}")
+    return _build(request, _BLOB_STORAGE_FACTORIES, "memory", "blob storage")
 
 
 @pytest.fixture
 def local_storage(request: SubRequest) -> FilestorageGateway:
     """Create a local storage to use within tests."""
-    param = getattr(request, "param", "temporary")
-    if isinstance(param, tuple):
-        kind, options = param
-    else:
-        kind = param
-        options = {}
-    if kind == "temporary":
-        return TemporaryDirectory(**options)
-    raise ValueError(f"Unknown local storage implementation: {kind}")
+    return _build(request, _LOCAL_STORAGE_FACTORIES, "temporary", "local storage")
@@ -1,4 +1,4 @@
-from hashlib import md5
+from hashlib import sha256
 
 import pytest
 
@@ -11,7 +11,7 @@ from tests.utils import parametrize_clock, parametrize_id_generator
 
 TEST_CONTENT = "<html><body></body></html>".encode()
 TEST_ARCHIVE = create_archive_from_content(TEST_CONTENT)
-TEST_CONTENT_MD5 = md5(TEST_ARCHIVE).hexdigest()
+TEST_CONTENT_CHECKSUM = sha256(TEST_ARCHIVE).hexdigest()
 
 
 @parametrize_id_generator("constant", value="fakeid")
@@ -1,4 +1,4 @@
-from hashlib import md5
+from hashlib import sha256
 
 import pytest
 from starlette import status
@@ -18,7 +18,7 @@ from tests.utils import parametrize_clock, parametrize_id_generator
 
 TEST_CONTENT = "<html><body></body></html>".encode()
 TEST_ARCHIVE = create_archive_from_content(TEST_CONTENT)
-TEST_CONTENT_MD5 = md5(TEST_ARCHIVE).hexdigest()
+TEST_CONTENT_CHECKSUM = sha256(TEST_ARCHIVE).hexdigest()
 
 
 def test_get_api_version(client: PagesAPITestHTTPClient):
@@ -169,7 +169,7 @@ def test_create_version_latest(client: PagesAPITestHTTPClient):
         page_id="fakeid",
         page_name="test",
         page_version="1",
-        checksum=TEST_CONTENT_MD5,
+        checksum=TEST_CONTENT_CHECKSUM,
         created_timestamp=0,
     )
     assert client.get_page("fakeid") == Page(
@@ -198,7 +198,7 @@ def test_create_version_non_latest(client: PagesAPITestHTTPClient):
             page_id="fakeid",
             page_name="test",
             page_version="1",
-            checksum=TEST_CONTENT_MD5,
+            checksum=TEST_CONTENT_CHECKSUM,
             created_timestamp=0,
         )
     )
@@ -265,7 +265,7 @@ def test_list_versions_many_results(client: PagesAPITestHTTPClient):
             page_id="fakeid",
             page_name="test",
             page_version=str(idx),
-            checksum=TEST_CONTENT_MD5,
+            checksum=TEST_CONTENT_CHECKSUM,
             created_timestamp=0,
         )
         for idx in range(10)
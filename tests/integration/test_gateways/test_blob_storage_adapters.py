@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 from _pytest.fixtures import SubRequest
 
@@ -26,6 +28,18 @@ class TestBlobStorage:
         read = await storage.get("key")
         assert read == b"data"
 
+    @pytest.mark.asyncio
+    async def test_put_stream(self, storage: BlobStorageGateway):
+        await storage.put("key", blob=b"data")
+        chunks = [chunk async for chunk in storage.stream("key")]
+        assert b"".join(chunks) == b"data"
+
+    @pytest.mark.asyncio
+    async def test_stream_not_found(self, storage: BlobStorageGateway):
+        with pytest.raises(BlobNotFoundError, match="Blob not found: key"):
+            async for _ in storage.stream("key"):
+                pass
+
     @pytest.mark.asyncio
     async def test_put_delete(self, storage: BlobStorageGateway):
         await storage.put("key", blob=b"data")
@@ -39,6 +53,14 @@ class TestBlobStorage:
         with pytest.raises(BlobNotFoundError, match="Blob not found: key"):
             await storage.delete("key")
 
+    @pytest.mark.asyncio
+    async def test_put_delete_many(self, storage: BlobStorageGateway):
+        await storage.put("key", "1", blob=b"data/1")
+        await storage.put("key", "2", blob=b"data/2")
+        await storage.put("other", blob=b"other")
+        await storage.delete_many(await storage.list_keys("key"))
+        assert await storage.list_keys() == ["other"]
+
     @pytest.mark.asyncio
     async def test_put_list_keys(self, storage: BlobStorageGateway):
         await storage.put("key", blob=b"data")
@@ -58,3 +80,38 @@ class TestBlobStorage:
         assert await storage.list_keys("key") == ["key", "key/1", "key/1/a"]
         assert await storage.list_keys("key", "1") == ["key/1", "key/1/a"]
         assert await storage.list_keys("key", "1", "a") == ["key/1/a"]
+
+    @pytest.mark.asyncio
+    async def test_put_list_keys_partial_prefix(self, storage: BlobStorageGateway):
+        await storage.put("key", "1", blob=b"data/1")
+        await storage.put("keys", "2", blob=b"data/2")
+        await storage.put("other", blob=b"otherdata")
+        assert await storage.list_keys("ke") == ["key/1", "keys/2"]
+        await storage.delete("key", "1")
+        assert await storage.list_keys("ke") == ["keys/2"]
+
+
+@pytest.mark.asyncio
+async def test_default_delete_many_bounded_concurrency():
+    class SlowBlobStorage(InMemoryBlobStorage):
+        max_concurrency = 2
+
+        def __init__(self) -> None:
+            super().__init__()
+            self.in_flight = 0
+            self.max_in_flight = 0
+
+        async def delete(self, *key: str) -> None:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            await asyncio.sleep(0)
+            await super().delete(*key)
+            self.in_flight -= 1
+
+    storage = SlowBlobStorage()
+    for idx in range(5):
+        await storage.put("key", str(idx), blob=b"data")
+    # Use default implementation
+    await BlobStorageGateway.delete_many(storage, await storage.list_keys("key"))
+    assert await storage.list_keys() == []
+    assert storage.max_in_flight == 2
@@ -40,6 +40,19 @@ class TestVersionRepository:
         )
         assert await repository.get_page_id("test") == "testid"
 
+    async def test_page_name_exists(self, repository: PageRepository):
+        assert await repository.page_name_exists("test") is False
+        await repository.create_page(
+            Page(
+                id="testid",
+                name="test",
+                title="Test",
+                description="Something",
+                latest_version=None,
+            )
+        )
+        assert await repository.page_name_exists("test") is True
+
     async def test_create_page_without_latest_version(self, repository: PageRepository):
         await repository.create_page(
             Page(
@@ -94,16 +107,16 @@ class TestVersionRepository:
         assert await repository.list_pages() == [page1, page2]
 
     async def test_delete_page(self, repository: PageRepository):
-        await repository.create_page(
-            Page(
-                id="testid",
-                name="test",
-                title="Test",
-                description="Something",
-                latest_version="1",
-            )
+        page = Page(
+            id="testid",
+            name="test",
+            title="Test",
+            description="Something",
+            latest_version="1",
         )
-        await repository.delete_page("testid")
+        await repository.create_page(page)
+        # Deleted page is returned
+        assert await repository.delete_page("testid") == page
         # Cannot be deleted twice
         with pytest.raises(PageNotFoundError, match="Page not found: testid"):
             await repository.delete_page("testid")
@@ -113,6 +126,9 @@ class TestVersionRepository:
         # No longer possible to get id
         with pytest.raises(PageNotFoundError, match="Page not found: test"):
             await repository.get_page_id("test")
+        # No longer possible to list versions
+        with pytest.raises(PageNotFoundError, match="Page not found: testid"):
+            await repository.list_versions("testid")
 
     async def test_update_latest_version_page_not_found(
         self, repository: PageRepository
@@ -207,6 +223,36 @@ class TestVersionRepository:
         read_version = await repository.get_version("fakeid", "1")
         assert write_version == read_version
         assert await repository.version_exists("fakeid", "1")
+        # Latest version is not updated by default
+        page = await repository.get_page("fakeid")
+        assert page.latest_version is None
+
+    async def test_create_version_latest(self, repository: PageRepository):
+        await repository.create_page(Page("fakeid", "test", "test", "", None))
+        await repository.create_version(
+            Version("fakeid", "test", "1", "", 0), latest=True
+        )
+        page = await repository.get_page("fakeid")
+        assert page.latest_version == "1"
+
+    async def test_get_latest_version(self, repository: PageRepository):
+        await repository.create_page(Page("fakeid", "test", "test", "", None))
+        with pytest.raises(
+            VersionNotFoundError, match="Version not found: test/latest"
+        ):
+            await repository.get_latest_version("fakeid")
+        version = Version("fakeid", "test", "1", "", 0)
+        await repository.create_version(version, latest=True)
+        assert await repository.get_latest_version("fakeid") == version
+
+    async def test_get_latest_version_missing(self, repository: PageRepository):
+        await repository.create_page(Page("fakeid", "test", "test", "", "1"))
+        with pytest.raises(VersionNotFoundError, match="Version not found: test/1"):
+            await repository.get_latest_version("fakeid")
+
+    async def test_get_latest_version_page_not_found(self, repository: PageRepository):
+        with pytest.raises(PageNotFoundError, match="Page not found: fakeid"):
+            await repository.get_latest_version("fakeid")
 
     async def test_get_version_page_not_found(self, repository: PageRepository):
         with pytest.raises(PageNotFoundError, match="Page not found: fakeid"):
@@ -91,6 +91,21 @@ class TestEventBusInterface:
         received_event = await waiter.wait()
         assert received_event.data == 12
 
+    async def test_event_bus_observe_event_static_and_variant(self, bus: EventBus):
+        static_event = create_event(
+            "test-1", "test.1", int, metadata_schema=t.Dict[str, str]
+        )
+        variant_event = create_event(
+            "test-any", "test.*", int, metadata_schema=t.Dict[str, str]
+        )
+        # Create a waiter for each event
+        static_waiter = await Waiter.create(bus.subscribe(static_event))
+        variant_waiter = await Waiter.create(bus.subscribe(variant_event))
+        # This event should be received by both waiters
+        await bus.publish(static_event, None, 12, {"test": "somemeta"}, timeout=0.1)
+        assert (await static_waiter.wait(timeout=0.1)).data == 12
+        assert (await variant_waiter.wait(timeout=0.1)).data == 12
+
     async def test_event_bus_request(self, bus: EventBus):
         """Test case for request/reply.
 
@@ -0,0 +1,75 @@
+import asyncio
+import typing as t
+
+import pytest
+
+from synopsys import create_event
+from synopsys.adapters.memory import InMemoryEventBus
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("address", ["test.1", "test.*"], ids=["static", "wildcard"])
+async def test_queue_group_delivery(address: str):
+    bus = InMemoryEventBus()
+    event = create_event("test", address, int, metadata_schema=t.Dict[str, str])
+    published = create_event("test", "test.1", int, metadata_schema=t.Dict[str, str])
+    async with bus.subscribe(event, queue="workers") as first, bus.subscribe(
+        event, queue="workers"
+    ) as second, bus.subscribe(event) as broadcast:
+        await bus.publish(published, None, 12, {})
+        # Subscriber outside of queue group always receive message
+        msg = await asyncio.wait_for(broadcast.__anext__(), timeout=0.1)
+        assert msg.data == 12
+        # A single subscriber within queue group receive message
+        tasks: t.List["asyncio.Future[t.Any]"] = [
+            asyncio.ensure_future(first.__anext__()),
+            asyncio.ensure_future(second.__anext__()),
+        ]
+        done, pending = await asyncio.wait(tasks, timeout=0.05)
+        for task in pending:
+            task.cancel()
+        assert len(done) == 1
+        assert done.pop().result().data == 12
+
+
+@pytest.mark.asyncio
+async def test_max_pending_messages():
+    bus = InMemoryEventBus(max_pending=2)
+    event = create_event("test", "test", int, metadata_schema=t.Dict[str, str])
+    async with bus.subscribe(event) as observer, bus.subscribe(
+        event, queue="workers"
+    ) as first, bus.subscribe(event, queue="workers") as second:
+        for idx in range(3):
+            await bus.publish(event, None, idx, {})
+        # Third message is dropped for observer with too many pending messages
+        assert (await asyncio.wait_for(observer.__anext__(), timeout=0.1)).data == 0
+        assert (await asyncio.wait_for(observer.__anext__(), timeout=0.1)).data == 1
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(observer.__anext__(), timeout=0.01)
+        # Third message is delivered to next member of queue group
+        received = []
+        for iterator in (first, second):
+            while True:
+                try:
+                    msg = await asyncio.wait_for(iterator.__anext__(), timeout=0.01)
+                except asyncio.TimeoutError:
+                    break
+                received.append(msg.data)
+        assert sorted(received) == [0, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_consumers_cancelled_on_exit():
+    bus = InMemoryEventBus()
+    event = create_event(
+        "test", "test", int, metadata_schema=t.Dict[str, str], reply_schema=int
+    )
+    async with bus.subscribe(event) as subscription, bus.serve(event) as requests:
+        tasks: t.List["asyncio.Future[t.Any]"] = [
+            asyncio.ensure_future(subscription.__anext__()),
+            asyncio.ensure_future(requests.__anext__()),
+        ]
+        await asyncio.sleep(0)
+    for task in tasks:
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(task, timeout=0.1)
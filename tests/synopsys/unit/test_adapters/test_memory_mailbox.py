@@ -0,0 +1,64 @@
+import asyncio
+
+import pytest
+
+from synopsys.adapters.memory.mailbox import Mailbox
+
+
+@pytest.mark.asyncio
+async def test_mailbox_fifo():
+    mailbox: Mailbox[int] = Mailbox()
+    for value in range(3):
+        mailbox.put_nowait(value)
+    assert len(mailbox) == 3
+    assert [await mailbox.get() for _ in range(3)] == [0, 1, 2]
+    assert len(mailbox) == 0
+
+
+@pytest.mark.asyncio
+async def test_mailbox_wakes_up_consumer():
+    mailbox: Mailbox[int] = Mailbox()
+    task = asyncio.create_task(mailbox.get())
+    await asyncio.sleep(0)
+    assert not task.done()
+    mailbox.put_nowait(1)
+    assert await asyncio.wait_for(task, timeout=0.1) == 1
+
+
+@pytest.mark.asyncio
+async def test_mailbox_get_cancelled():
+    mailbox: Mailbox[int] = Mailbox()
+    task = asyncio.create_task(mailbox.get())
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    mailbox.put_nowait(1)
+    assert await mailbox.get() == 1
+
+
+def test_mailbox_full():
+    mailbox: Mailbox[int] = Mailbox(maxsize=1)
+    mailbox.put_nowait(1)
+    with pytest.raises(asyncio.QueueFull):
+        mailbox.put_nowait(2)
+
+
+@pytest.mark.asyncio
+async def test_mailbox_close_cancels_consumer():
+    mailbox: Mailbox[int] = Mailbox()
+    task = asyncio.create_task(mailbox.get())
+    await asyncio.sleep(0)
+    mailbox.close()
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.wait_for(task, timeout=0.1)
+
+
+@pytest.mark.asyncio
+async def test_mailbox_closed_drains_items():
+    mailbox: Mailbox[int] = Mailbox()
+    mailbox.put_nowait(1)
+    mailbox.close()
+    assert await mailbox.get() == 1
+    with pytest.raises(asyncio.CancelledError):
+        await mailbox.get()
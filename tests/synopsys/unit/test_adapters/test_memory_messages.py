@@ -0,0 +1,17 @@
+import typing as t
+
+from synopsys import create_event
+from synopsys.adapters.memory.messages import InMemoryMessage
+
+
+def test_messages_use_identity_equality():
+    evt = create_event("test", "test", int, metadata_schema=t.Dict[str, str])
+    first = InMemoryMessage(evt, subject="test", payload=12, headers={})
+    second = InMemoryMessage(evt, subject="test", payload=12, headers={})
+    assert first != second
+    assert first == first
+    assert len({first, second}) == 2
+    assert first.equals(second)
+    assert not first.equals(
+        InMemoryMessage(evt, subject="test", payload=13, headers={})
+    )
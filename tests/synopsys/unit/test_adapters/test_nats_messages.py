@@ -0,0 +1,38 @@
+import typing as t
+
+from nats.aio.msg import Msg
+
+from synopsys import create_event
+from synopsys.adapters.codecs.pydantic import PydanticCodec
+from synopsys.adapters.nats.messages import NATSMessage
+
+
+class SpyCodec(PydanticCodec):
+    def __init__(self) -> None:
+        self.decoded = 0
+        self.parsed = 0
+
+    def decode(self, raw: bytes, schema: t.Any) -> t.Any:
+        self.decoded += 1
+        return super().decode(raw, schema)
+
+    def parse_obj(self, data: t.Any, schema: t.Any) -> t.Any:
+        self.parsed += 1
+        return super().parse_obj(data, schema)
+
+
+def test_message_is_decoded_lazily():
+    codec = SpyCodec()
+    evt = create_event("test", "test", int, metadata_schema=t.Dict[str, str])
+    msg = NATSMessage(
+        evt,
+        Msg(t.cast(t.Any, None), subject="test", data=b"12", headers={"a": "b"}),
+        codec=codec,
+    )
+    assert (codec.decoded, codec.parsed) == (0, 0)
+    assert msg.data == 12
+    assert msg.data == 12
+    assert codec.decoded == 1
+    assert msg.metadata == {"a": "b"}
+    assert msg.metadata == {"a": "b"}
+    assert codec.parsed == 1
@@ -0,0 +1,41 @@
+import json
+import typing as t
+from dataclasses import dataclass
+from datetime import datetime
+
+import pytest
+
+from synopsys.adapters.codecs import json as json_codec
+
+
+@dataclass
+class Document:
+    name: str
+    blob: bytes
+    created: datetime
+    tags: t.Set[str]
+
+
+DOCUMENT = Document(
+    name="test",
+    blob=b"\x00\xff",
+    created=datetime(2023, 1, 1, 12, 30, 15),
+    tags={"a"},
+)
+EXPECTED = {
+    "name": "test",
+    "blob": "AP8=",
+    "created": "2023-01-01T12:30:15",
+    "tags": ["a"],
+}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib"])
+def test_dump_dataclass(monkeypatch: pytest.MonkeyPatch, use_orjson: bool):
+    if not use_orjson:
+        monkeypatch.setattr(json_codec, "orjson", None)
+    elif json_codec.orjson is None:
+        pytest.skip("orjson is not installed")
+    assert json.loads(json_codec.dump(DOCUMENT)) == EXPECTED
+    assert json.loads(json_codec.dumps(DOCUMENT)) == EXPECTED
+    assert json.loads(json_codec.dump({1: "a"}, sort_keys=True)) == {"1": "a"}
@@ -0,0 +1,54 @@
+import typing as t
+from dataclasses import dataclass
+
+from synopsys.adapters.codecs import PydanticCodec
+
+
+@dataclass
+class Document:
+    name: str
+    blob: bytes
+
+
+@dataclass
+class Envelope:
+    document: Document
+    content: bytes
+    latest: bool
+
+
+@dataclass
+class OptionalEnvelope:
+    document: t.Optional[Document]
+    content: t.Optional[bytes] = None
+
+
+def test_codec_bytes_roundtrip():
+    codec = PydanticCodec()
+    payload = Envelope(
+        document=Document(name="test", blob=b"\x00\xff"),
+        content=bytes(range(256)),
+        latest=True,
+    )
+    assert codec.decode(codec.encode(payload), Envelope) == payload
+
+
+def test_codec_optional_bytes_roundtrip():
+    codec = PydanticCodec()
+    payload = OptionalEnvelope(
+        document=Document(name="test", blob=b"\x00\xff"), content=b"\xff"
+    )
+    assert codec.decode(codec.encode(payload), OptionalEnvelope) == payload
+    empty = OptionalEnvelope(document=None)
+    assert codec.decode(codec.encode(empty), OptionalEnvelope) == empty
+
+
+def test_codec_raw_bytes():
+    codec = PydanticCodec()
+    assert codec.decode(codec.encode(b"\x00\xff"), bytes) == b"\x00\xff"
+
+
+def test_codec_dict():
+    codec = PydanticCodec()
+    payload = {"a": 1, "b": [1, 2]}
+    assert codec.decode(codec.encode(payload), t.Dict[str, t.Any]) == payload
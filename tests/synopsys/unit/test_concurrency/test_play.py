@@ -1,12 +1,15 @@
 import asyncio
+import sys
 import typing as t
+from contextlib import asynccontextmanager
 
 import pytest
 
 from synopsys import Event, Message, create_event
 from synopsys.adapters.memory import InMemoryEventBus
-from synopsys.concurrency import Play
-from synopsys.core.actors import Subscriber
+from synopsys.concurrency import ExceptionGroup, Play
+from synopsys.core.actors import Actor, Subscriber
+from synopsys.instrumentation.play import PlayInstrumentation
 
 T = t.TypeVar("T")
 
@@ -49,6 +52,29 @@ class MockSubscriber:
         return Subscriber(self.event, self)
 
 
+class FailingEventBus(InMemoryEventBus):
+    """An event bus whose subscriptions fail for events named 'fail'."""
+
+    @asynccontextmanager
+    async def subscribe(
+        self, event: t.Any, queue: t.Optional[str] = None
+    ) -> t.AsyncIterator[t.AsyncIterator[t.Any]]:
+        if event.name != "fail":
+            async with super().subscribe(event, queue) as iterator:
+                yield iterator
+            return
+
+        async def fail() -> None:
+            await asyncio.sleep(0)
+            raise RuntimeError("BOOM")
+
+        async def failing_iterator() -> t.AsyncIterator[t.Any]:
+            await fail()
+            yield  # pragma: no cover
+
+        yield failing_iterator()
+
+
 @pytest.mark.asyncio
 class TestActorsGroup:
     async def test_actors_play_start_idempotent(self):
@@ -124,3 +150,76 @@ class TestActorsGroup:
         assert len(mock.received_events) == 1
         assert len(other_mock.received_events) == 5
         assert play.done()
+
+    async def test_actors_play_wait(self):
+        event = create_event("test-event", "test", int)
+        actor = MockSubscriber(event)
+        async with Play(InMemoryEventBus(), [actor.get_actor()]) as play:
+            # Actor never stops by itself so wait times out
+            await play.wait(timeout=0.01)
+            assert not play.done()
+            # Actor is stopped once cancelled
+            play.cancel()
+            await asyncio.wait_for(play.wait(), timeout=1)
+            assert play.done()
+
+    async def test_actors_play_subclassed_actor(self):
+        class CustomSubscriber(Subscriber[t.Any, t.Any, t.Any]):
+            pass
+
+        bus = InMemoryEventBus()
+        event = create_event("test-event", "test", int)
+        mock = MockSubscriber(event)
+        async with Play(bus, [CustomSubscriber(event, mock)]):
+            await bus.publish(event, scope=None, payload=1, metadata=None)
+            await asyncio.sleep(0.01)
+        assert len(mock.received_events) == 1
+
+    async def test_actors_play_unsupported_actor(self):
+        with pytest.raises(TypeError, match="Actor type not supported"):
+            async with Play(InMemoryEventBus(), [Actor()]):
+                pass  # pragma: no cover
+
+    async def test_actors_play_failure_cancels_other_actors(self):
+        failing = MockSubscriber(create_event("fail", "fail", int))
+        other = MockSubscriber(create_event("other", "other", int))
+        with pytest.raises(ExceptionGroup) as exc_info:
+            async with Play(
+                FailingEventBus(), [failing.get_actor(), other.get_actor()]
+            ) as play:
+                await asyncio.wait_for(play.wait(), timeout=1)
+                assert play.done()
+        # Other actor is cancelled, and cancellation does not leak to the caller
+        assert [str(err) for err in exc_info.value.errors] == ["BOOM"]
+        if sys.version_info >= (3, 11):
+            current_task = asyncio.current_task()
+            assert current_task is not None
+            assert current_task.cancelling() == 0
+        # Would raise CancelledError if a cancellation had been requested
+        await asyncio.sleep(0)
+
+    async def test_actors_play_concurrent_stop(self):
+        stopping: t.List[Play] = []
+
+        class SpyStopping(PlayInstrumentation):
+            def play_stopping(self, play: Play) -> None:
+                stopping.append(play)
+
+        event = create_event("test-event", "test", int)
+        actor = MockSubscriber(event)
+        play = Play(
+            InMemoryEventBus(), [actor.get_actor()], instrumentation=SpyStopping()
+        )
+        await play.start()
+        await asyncio.gather(play.stop(), play.stop())
+        await play.stop()
+        assert stopping == [play]
+        assert play.done()
+
+    async def test_actors_play_ignores_duplicated_actors(self):
+        event = create_event("test-event", "test", int)
+        actor = MockSubscriber(event).get_actor()
+        other = MockSubscriber(event).get_actor()
+        play = Play(InMemoryEventBus(), [actor, actor])
+        play.extend(actor, other, other)
+        assert play.actors == [actor, other]
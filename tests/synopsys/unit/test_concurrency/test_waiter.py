@@ -0,0 +1,32 @@
+import asyncio
+import typing as t
+
+import pytest
+
+from synopsys import create_event
+from synopsys.adapters.memory import InMemoryEventBus
+from synopsys.concurrency import Waiter
+
+
+@pytest.mark.asyncio
+async def test_waiter_observes_event_published_after_create():
+    bus = InMemoryEventBus()
+    event = create_event("test-event", "test", int)
+    waiter = await Waiter.create(bus.subscribe(event))
+    await bus.publish(event, scope=None, payload=1, metadata=None)
+    msg = await waiter.wait(timeout=0.1)
+    assert msg.data == 1
+
+
+@pytest.mark.asyncio
+async def test_waiter_channel_failure():
+    class FailingChannel:
+        async def __aenter__(self) -> t.AsyncIterator[t.Any]:
+            raise RuntimeError("BOOM")
+
+        async def __aexit__(self, *args: t.Any) -> None:
+            pass  # pragma: no cover
+
+    waiter = await asyncio.wait_for(Waiter.create(FailingChannel()), timeout=0.1)
+    with pytest.raises(RuntimeError, match="BOOM"):
+        await waiter.wait(timeout=0.1)
@@ -0,0 +1,32 @@
+from synopsys import EMPTY, EventQueue, EventStream, create_event
+from synopsys.core.events import QueuePolicy
+
+
+def test_event_stream_defaults():
+    event = create_event("test", "test.event", EMPTY)
+    stream = EventStream("test", [event])
+    assert stream.name == "test"
+    assert stream.events == [event]
+    assert stream.limit is None
+
+
+def test_event_queue_defaults():
+    stream = EventStream("test", [create_event("test", "test.event", EMPTY)])
+    queue: EventQueue[None, None, None] = EventQueue(
+        "test",
+        stream,
+        max_pending=1,
+        max_wait=1,
+        inactive_theshold=1,
+        policy=QueuePolicy.ALL,
+    )
+    assert queue.stream is stream
+    assert queue.filters is None
+    assert queue == EventQueue(
+        "test",
+        stream,
+        max_pending=1,
+        max_wait=1,
+        inactive_theshold=1,
+        policy=QueuePolicy.ALL,
+    )
@@ -73,3 +73,14 @@ def test_event_proper_scope_annotations():
     assert event.name == "test"
     assert event.scope == EventScope
     assert event.address == "test.{device}.{location}"
+
+
+def test_event_address_parsing_is_shared():
+    class EventScope(TypedDict):
+        device: str
+
+    event = create_event("test", "test.{device}", EMPTY, scope=EventScope)
+    other_event = create_event("other", "test.{device}", int, scope=EventScope)
+    assert event._tokens == ("test", "*")
+    assert event._tokens is other_event._tokens
+    assert event._placeholders is other_event._placeholders
@@ -1,4 +1,5 @@
 import typing as t
+from enum import Enum
 from re import escape
 
 import pytest
@@ -17,6 +18,7 @@ from synopsys import EMPTY, create_event
             {"device": "XXX", "location": "westus"},
             "test.XXX.westus",
         ),
+        ("test.{device-id}", {"device-id": "XXX"}, "test.XXX"),
     ],
 )
 def test_get_subject(
@@ -55,3 +57,18 @@ def test_get_subject_static_event():
 def test_render_subject_static_event():
     evt = create_event("test", "test", EMPTY, reply_schema=EMPTY)
     assert evt.get_subject() == "test"
+
+
+class Location(str, Enum):
+    WEST = "westus"
+
+
+def test_get_subject_str_enum_value():
+    event = create_event("test", "test.{device}", EMPTY, scope=dict)
+    assert event.get_subject({"device": Location.WEST}) == "test.westus"
+
+
+def test_get_subject_non_str_value():
+    event = create_event("test", "test.{device}", EMPTY, scope=dict)
+    with pytest.raises(TypeError):
+        event.get_subject({"device": 1})
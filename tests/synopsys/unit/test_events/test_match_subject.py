@@ -18,9 +18,12 @@ from synopsys import EMPTY, create_event
         ("a", "b", False),
         ("a.b", "{device}", False),
         ("a.a", "a.b", False),
+        ("a.b", "a.bc", False),
+        ("a.bc", "a.b", False),
         ("a.b.c", "a.{device}", False),
         ("a", "a.b", False),
         ("a", "a.{device}", False),
+        ("a.b.c.d", "a.{device}.c", False),
         # ("a", "a.{...parts}", False),
     ],
 )
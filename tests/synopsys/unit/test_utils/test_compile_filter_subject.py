@@ -0,0 +1,39 @@
+import pytest
+
+from synopsys.core.events import DEFAULT_SYNTAX
+from synopsys.core.utils import compile_filter_subject
+
+
+@pytest.mark.parametrize(
+    "subject,filter,match",
+    [
+        ("a", "a", True),
+        ("ab", "*", True),
+        ("ab", ">", True),
+        ("ab.a", "ab.a", True),
+        ("ab.a", "ab.*", True),
+        ("a.b.c", "*.b.c", True),
+        ("a.b.c", "a.*.c", True),
+        ("a.b.c", "a.b.*", True),
+        ("ab.a", ">", True),
+        ("ab.a", "ab.>", True),
+        ("a+b", "a+b", True),
+        ("a", "b", False),
+        ("a.b", "*", False),
+        ("a.a", "a.b", False),
+        ("a.b.c", "a.*", False),
+        ("a", "a.b", False),
+        ("a", "a.*", False),
+        ("a", "a.>", False),
+        ("a.b.c.d", "a.*.c", False),
+        ("ab", "a+b", False),
+    ],
+)
+def test_compile_filter_subject(subject: str, filter: str, match: bool):
+    pattern = compile_filter_subject(filter, DEFAULT_SYNTAX)
+    assert pattern is not None
+    assert (pattern.fullmatch(subject) is not None) is match
+
+
+def test_compile_filter_subject_match_all_not_last():
+    assert compile_filter_subject("a.>.b", DEFAULT_SYNTAX) is None
@@ -0,0 +1,35 @@
+import typing as t
+
+import pytest
+
+from synopsys.core.events import DEFAULT_SYNTAX
+from synopsys.core.utils import compile_placeholders_pattern
+
+
+@pytest.mark.parametrize(
+    "subject,placeholders,result",
+    [
+        ("test", {}, {}),
+        ("test.someid", {"device": 1}, {"device": "someid"}),
+        (
+            "test.someid.westus",
+            {"location": 2, "device": 1},
+            {"device": "someid", "location": "westus"},
+        ),
+        ("someid.test.other", {"device": 0}, {"device": "someid"}),
+    ],
+)
+def test_compile_placeholders_pattern(
+    subject: str, placeholders: t.Dict[str, int], result: t.Dict[str, str]
+):
+    names, pattern = compile_placeholders_pattern(placeholders, DEFAULT_SYNTAX)
+    match = pattern.match(subject)
+    assert match is not None
+    assert dict(zip(names, match.groups())) == result
+
+
+def test_compile_placeholders_pattern_missing():
+    _, pattern = compile_placeholders_pattern(
+        {"device": 1, "location": 2}, DEFAULT_SYNTAX
+    )
+    assert pattern.match("test.device") is None
@@ -0,0 +1,28 @@
+import typing as t
+
+import pytest
+
+from synopsys.core.events import DEFAULT_SYNTAX
+from synopsys.core.utils import compile_subject_template
+
+
+@pytest.mark.parametrize(
+    "tokens,placeholders,result",
+    [
+        (["test"], {}, "test"),
+        (["test", "*"], {"device": 1}, "test.{device}"),
+        (["*", "test", "*"], {"device": 0, "location": 2}, "{device}.test.{location}"),
+        (["te{st}", "*"], {"device": 1}, "te{{st}}.{device}"),
+    ],
+)
+def test_compile_subject_template(
+    tokens: t.List[str], placeholders: t.Dict[str, int], result: str
+):
+    assert compile_subject_template(tokens, placeholders, DEFAULT_SYNTAX) == result
+
+
+def test_compile_subject_template_invalid_field_name():
+    assert (
+        compile_subject_template(["test", "*"], {"device-id": 1}, DEFAULT_SYNTAX)
+        is None
+    )
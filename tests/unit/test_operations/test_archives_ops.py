@@ -1,3 +1,4 @@
+from io import BytesIO
 from pathlib import Path
 from re import escape
 from tempfile import TemporaryDirectory
@@ -9,6 +10,7 @@ from pyhosting.domain.operations.archives import (
     create_archive,
     create_archive_from_content,
     unpack_archive,
+    unpack_archive_fileobj,
     validate_filenames,
     validate_tarfile,
 )
@@ -128,6 +130,15 @@ class TestArchivesOperations:
         assert destination.is_dir()
         check_spa_dir(destination)
 
+    def test_unpack_archive_fileobj(self, root: Path, spa: Path):
+        compressed = create_archive(spa)
+        destination = root.joinpath("test")
+        unpack_archive_fileobj(
+            BytesIO(compressed), destination=destination, omit_top_level=True
+        )
+        assert destination.is_dir()
+        check_spa_dir(destination)
+
     def test_create_archive_and_unpack_archive_with_top_level_idempotent(
         self, root: Path, spa: Path
     ):
@@ -1,4 +1,4 @@
-from hashlib import md5
+from hashlib import sha256
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
@@ -37,7 +37,7 @@ from tests.utils import parametrize_id_generator, parametrize_page_repository
 
 TEST_CONTENT = "<html></html>".encode("utf-8")
 TEST_ARCHIVE = create_archive_from_content(TEST_CONTENT)
-TEST_MD5 = md5(TEST_ARCHIVE).hexdigest()
+TEST_CHECKSUM = sha256(TEST_ARCHIVE).hexdigest()
 
 
 @pytest.mark.asyncio
@@ -75,7 +75,7 @@ class TestPublishVersion:
         event = await waiter.wait(0.1)
         assert event.data == VersionCreated(
             document=version,
-            content=TEST_ARCHIVE.hex(),
+            content=TEST_ARCHIVE,
             latest=False,
         )
         # Check page entity
@@ -87,7 +87,7 @@ class TestPublishVersion:
             page_id="fakeid",
             page_name="test",
             page_version="1",
-            checksum=TEST_MD5,
+            checksum=TEST_CHECKSUM,
             created_timestamp=0,
         )
 
@@ -127,7 +127,7 @@ class TestPublishVersion:
         event = await waiter.wait()
         assert event.data == VersionCreated(
             document=version,
-            content=TEST_ARCHIVE.hex(),
+            content=TEST_ARCHIVE,
             latest=True,
         )
         # Test page entity query
@@ -139,7 +139,7 @@ class TestPublishVersion:
             page_id="fakeid",
             page_name="test",
             page_version="1",
-            checksum=TEST_MD5,
+            checksum=TEST_CHECKSUM,
             created_timestamp=0,
         )
 
@@ -553,6 +553,37 @@ class TestUpdateLatestVersion:
         ):
             await command("not-an-existing-id", "1")
 
+    @parametrize_id_generator("constant", value="fakeid")
+    async def test_update_latest_version_from_entity(
+        self,
+        id_generator: IDGenerator,
+        page_repository: PageRepository,
+        event_bus: EventBus,
+    ):
+        # Prepare test (create page and version)
+        create_page = commands.pages.CreatePage(
+            id_generator=id_generator,
+            page_repository=page_repository,
+            event_bus=event_bus,
+        )
+        page = await create_page(name="test")
+        publish_version = commands.pages.PublishVersion(
+            page_repository=page_repository, event_bus=event_bus, clock=lambda: 0
+        )
+        version = await publish_version(
+            page.id,
+            "1",
+            content=TEST_ARCHIVE,
+            latest=False,
+        )
+        # Run test
+        command = commands.pages.UpdateLatestPageVersion(page_repository)
+        await command.update(version)
+        # Check that latest version was updated
+        query = queries.pages.GetPage(page_repository=page_repository)
+        page = await query(page_id="fakeid")
+        assert page.latest_version == "1"
+
 
 @pytest.mark.asyncio
 @parametrize_page_repository("memory")
@@ -684,10 +715,46 @@ class TestDeleteVersion:
                 page_id="fakeid",
                 page_name="test",
                 page_version="2",
-                checksum=md5(TEST_ARCHIVE).hexdigest(),
+                checksum=sha256(TEST_ARCHIVE).hexdigest(),
                 created_timestamp=0,
             )
         )
 
         with pytest.raises(VersionNotFoundError, match="Version not found: test/1"):
             await query_version(page_id="fakeid", page_version="1")
+
+    @parametrize_id_generator("constant", value="fakeid")
+    async def test_delete_version_from_page_entity(
+        self,
+        id_generator: IDGenerator,
+        page_repository: PageRepository,
+        event_bus: EventBus,
+    ):
+        create_page = commands.pages.CreatePage(
+            id_generator=id_generator,
+            page_repository=page_repository,
+            event_bus=event_bus,
+        )
+        page = await create_page(name="test")
+        publish_version = commands.pages.PublishVersion(
+            page_repository=page_repository,
+            event_bus=event_bus,
+            clock=lambda: 0,
+        )
+        await publish_version(
+            page_id="fakeid",
+            page_version="1",
+            content=TEST_ARCHIVE,
+            latest=False,
+        )
+        # Run test
+        command = commands.pages.DeletePageVersion(
+            page_repository=page_repository,
+            event_bus=event_bus,
+        )
+        waiter = await Waiter.create(event_bus.subscribe(VERSION_DELETED))
+        await command.delete(page, page_version="1")
+        event = await waiter.wait(0.1)
+        assert event.data == VersionDeleted(
+            page_id="fakeid", page_name="test", page_version="1"
+        )
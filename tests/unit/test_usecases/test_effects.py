@@ -1,7 +1,9 @@
-from hashlib import md5
+import typing as t
+from hashlib import sha256
 
 import pytest
 
+from pyhosting.adapters.gateways import InMemoryBlobStorage
 from pyhosting.adapters.gateways.templates import Jinja2Loader
 from pyhosting.domain.entities import Page, Version
 from pyhosting.domain.errors import BlobNotFoundError
@@ -26,7 +28,7 @@ from synopsys.concurrency import Waiter
 
 TEST_CONTENT = "<html></html>".encode("utf-8")
 TEST_ARCHIVE = create_archive_from_content(TEST_CONTENT)
-TEST_MD5 = md5(TEST_ARCHIVE).hexdigest()
+TEST_CHECKSUM = sha256(TEST_ARCHIVE).hexdigest()
 
 
 @pytest.mark.asyncio
@@ -50,10 +52,10 @@ class TestUploadContentOnVersionCreated:
                         page_id="testid",
                         page_name="test",
                         page_version="1",
-                        checksum=TEST_MD5,
+                        checksum=TEST_CHECKSUM,
                         created_timestamp=0,
                     ),
-                    content=TEST_ARCHIVE.hex(),
+                    content=TEST_ARCHIVE,
                     latest=False,
                 ),
                 headers=None,
@@ -275,3 +277,41 @@ class TestUpdateCacheOnVersionUploaded:
         )
         assert not local_storage.get_path("test", "__latest__", "index.html").exists()
         assert not local_storage.get_path("test", "__latest__").exists()
+
+    async def test_download_to_local_storage_from_streaming_blob_storage(
+        self,
+        local_storage: FilestorageGateway,
+    ):
+        class StreamingBlobStorage(InMemoryBlobStorage):
+            async def stream(
+                self, *key: str, chunk_size: int = 64 * 1024
+            ) -> t.AsyncIterator[bytes]:
+                content = await self.get(*key)
+                for idx in range(0, len(content), 16):
+                    yield content[idx : idx + 16]
+
+        # Prepare test
+        blob_storage = StreamingBlobStorage()
+        await blob_storage.put("testid", "1", blob=TEST_ARCHIVE)
+        # Run actor
+        effect = pages_data_plane.UpdateCacheOnVersionUploaded(
+            local_storage=local_storage,
+            blob_storage=blob_storage,
+        )
+        await effect(
+            Msg(
+                VERSION_UPLOADED,
+                subject="test",
+                payload=VersionUploaded(
+                    page_id="testid",
+                    page_name="test",
+                    page_version="1",
+                    is_latest=False,
+                ),
+                headers=None,
+            )
+        )
+        assert (
+            local_storage.get_path("test", "1", "index.html").read_bytes()
+            == TEST_CONTENT
+        )
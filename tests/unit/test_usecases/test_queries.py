@@ -123,6 +123,27 @@ class TestListPages:
             for idx in range(10)
         ]
 
+    async def test_iter_pages_many(
+        self,
+        page_repository: PageRepository,
+    ):
+        # Directly write into page repository
+        for idx in range(10):
+            await page_repository.create_page(
+                Page(
+                    id=f"test-{idx}",
+                    name=f"test-{idx}",
+                    title="test",
+                    description="",
+                    latest_version=None,
+                )
+            )
+        # Iterate over pages
+        query = queries.pages.ListPages(page_repository)
+        batches = [batch async for batch in query.iter(page_size=4)]
+        assert [len(batch) for batch in batches] == [4, 4, 2]
+        assert [page for batch in batches for page in batch] == await query()
+
 
 @pytest.mark.asyncio
 @parametrize_page_repository("memory")